@@ -6,15 +6,26 @@ import threading
 import dotenv
 import json
 import logging
+import logging.handlers
+import queue
+import atexit
 import re
-import urllib.request
 import io
+import string
 import zipfile
 import datetime
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Tuple, Dict, Any, Optional
 
-dotenv.load_dotenv()
 import fal_client
+import httpx
+
+# Pillow is optional; with it, saved story images are stored as WebP instead of PNG
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
 
 # Set up logging
 logging.basicConfig(
@@ -39,22 +50,232 @@ DARK_GRAY = (50, 50, 50)
 BLUE = (0, 0, 255)
 TITLE_BLUE = (0, 0, 180)
 
+# Maximum number of scene images generated concurrently (keeps us within FAL rate limits)
+MAX_IMAGE_WORKERS = 5
+# Maximum number of FAL requests in flight at once, across all worker threads
+MAX_CONCURRENT_FAL_REQUESTS = 5
+# Format and quality of the images stored in saved stories
+SAVED_IMAGE_FORMAT = "webp" if Image else "png"
+WEBP_QUALITY = 90
+
+# Maximum number of story files whose metadata is read concurrently when listing saved stories
+MAX_METADATA_WORKERS = 8
+
+# LLM model used for all text generation steps
+STORY_LLM_MODEL = "openai/gpt-4o"
+# Number of LLM responses kept in memory, so identical requests skip the API call
+LLM_CACHE_SIZE = 512
+# Upper bound on the tokens generated per LLM request. The longest legitimate reply, a combined
+# 10-scene story with image prompts, stays well under it; it only stops a runaway response
+LLM_MAX_TOKENS = 4096
+
+# Static instructions for each text generation step. These are sent as the system prompt so the
+# prefix of every request is byte-identical between runs and can be served from the provider's
+# prompt cache; only the short, request-specific part goes in the user prompt after it.
+SKETCH_SYSTEM_PROMPT = """You plan short illustrated stories.
+Your response should include:
+1. A brief story synopsis (2-3 sentences)
+2. Main plot points, one for each scene of the requested structure
+3. Key themes or motifs
+4. Critical story elements (items, places, events)
+
+Format your response in clear sections with headers. Keep the entire response under 400 words."""
+
+CHARACTER_SYSTEM_PROMPT = """You write character profiles for illustrated stories.
+Create a comprehensive character profile including:
+
+1. PHYSICAL APPEARANCE: Age, gender, distinguishing features, style of dress, and other visual characteristics that would be important for illustration.
+
+2. PERSONALITY: Key personality traits, values, fears, desires, and quirks that define this character.
+
+3. BACKGROUND: Brief relevant backstory elements that influence the character's actions in this story.
+
+4. RELATIONSHIPS: Important connections to other characters or entities in the story.
+
+5. GROWTH ARC: How this character might change throughout the story.
+
+Format this as a clear profile that can be referenced when creating story scenes and illustrations. Be specific and visual where possible.
+If the user supplies additional character information, incorporate those details into the profile."""
+
+SCENE_SYSTEM_PROMPT = """You write the scenes of illustrated stories from a story sketch and a character profile.
+Format your response exactly as follows, with one SCENE / IMAGE PROMPT pair for every requested scene, numbered from 1:
+
+SCENE 1: [Vivid, detailed description of the first scene. Make it highly visual and descriptive, focusing on the character's experience.]
+IMAGE PROMPT 1: [A single-paragraph illustration prompt for scene 1 describing composition, setting, lighting and mood, restating the main character's physical appearance from the profile.]
+
+SCENE 2: [Vivid, detailed description of the second scene that builds from the first. Again, make it visual and incorporate character details.]
+IMAGE PROMPT 2: [Illustration prompt for scene 2, in the same form as above.]
+
+Continue in the same way for each remaining scene, advancing the story and ensuring character continuity.
+
+Keep each scene description between 100-150 words and each image prompt under 80 words. Make each scene visually distinctive and memorable, perfect for illustration. Ensure the character remains consistent throughout all scenes, and that the narrative builds logically from one scene to the next."""
+
+IMAGE_PROMPT_SYSTEM_PROMPT = """You write prompts for an illustration model from numbered story scenes and a character profile.
+For every scene you are given, write a single-paragraph illustration prompt describing composition, setting, lighting and mood, restating the main character's physical appearance from the profile.
+Format your response exactly as follows, using the scene numbers you were given:
+
+IMAGE PROMPT 1: [Illustration prompt for scene 1]
+
+IMAGE PROMPT 2: [Illustration prompt for scene 2]
+
+Keep each image prompt under 80 words."""
+
+COMBINED_SYSTEM_PROMPT = """You write complete illustrated stories: a story sketch, a profile of the main character, and the scenes.
+Your response must have exactly three sections, in this order, each starting with its header line written exactly as shown:
+
+=== STORY SKETCH ===
+A brief story synopsis (2-3 sentences), the main plot points (one for each scene), key themes or motifs, and critical story elements (items, places, events). Keep this section under 400 words.
+
+=== CHARACTER PROFILE ===
+PHYSICAL APPEARANCE: Age, gender, distinguishing features, style of dress, and other visual characteristics that would be important for illustration.
+PERSONALITY: Key personality traits, values, fears, desires, and quirks that define this character.
+BACKGROUND: Brief relevant backstory elements that influence the character's actions in this story.
+RELATIONSHIPS: Important connections to other characters or entities in the story.
+GROWTH ARC: How this character might change throughout the story.
+Be specific and visual where possible. If the user supplies character information, incorporate those details into the profile.
+
+=== SCENES ===
+One SCENE / IMAGE PROMPT pair for every requested scene, numbered from 1:
+
+SCENE 1: [Vivid, detailed description of the first scene. Make it highly visual and descriptive, focusing on the character's experience.]
+IMAGE PROMPT 1: [A single-paragraph illustration prompt for scene 1 describing composition, setting, lighting and mood, restating the main character's physical appearance from the profile.]
+
+SCENE 2: [Vivid, detailed description of the second scene that builds from the first.]
+IMAGE PROMPT 2: [Illustration prompt for scene 2, in the same form as above.]
+
+Continue in the same way for each remaining scene. Keep each scene description between 100-150 words and each image prompt under 80 words. Ensure the character remains consistent throughout all scenes, and that the narrative builds logically from one scene to the next."""
+
+# Section headers of a combined story response, e.g. "=== CHARACTER PROFILE ===" or "## SCENES"
+_SECTION_RE = re.compile(r'^[\s*#=_]*(STORY SKETCH|CHARACTER PROFILE|SCENES)[\s*#=_:]*$', re.MULTILINE)
+
+# The PHYSICAL APPEARANCE section of a character profile, up to the line that starts the next section
+_PHYSICAL_RE = re.compile(
+    r'PHYSICAL APPEARANCE[*_:\s]*(.*?)(?=\n[^\n]*(?:PERSONALITY|BACKGROUND|RELATIONSHIPS|GROWTH)|\Z)',
+    re.DOTALL
+)
+
+# Scene and image prompt markers in LLM responses, e.g. "SCENE 2: text" or "**IMAGE PROMPT 2:** text".
+# The scene number (optional for image prompts) and the text following the marker are captured.
+_SCENE_RE = re.compile(r'^[\s*#_]*SCENE\s+(\d+)[\s*_]*:?[\s*_]*(.*)$')
+_IMAGE_PROMPT_RE = re.compile(r'^[\s*#_]*IMAGE PROMPT(?:\s+(\d+))?[\s*_]*:?[\s*_]*(.*)$')
+# Scene markers complete enough for _SCENE_RE to match, found anywhere in a streamed response
+_SCENE_MARKER_RE = re.compile(r'^[\s*#_]*SCENE\s+\d+', re.MULTILINE)
+
+# Read size used when streaming image downloads into memory
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# Image download connection pool settings. Two connections per image worker, so downloads for a
+# story never wait for a free connection, even with on-demand page fetches running alongside
+HTTP_POOL_SIZE = 2 * MAX_IMAGE_WORKERS
+HTTP_RETRIES = 3
+IMAGE_DOWNLOAD_TIMEOUT = 30  # seconds
+
+# Send a trivial request at startup so the first story does not pay the connection set-up cost
+WARM_UP_ON_START = True
+# Download every scene image as soon as it is generated. When off, only the URLs are collected and
+# each image is downloaded the first time its page is shown
+PREFETCH_IMAGES = True
+# Threads decoding downloaded scene images, off both the UI and the generation thread
+IMAGE_DECODE_WORKERS = 2
+# Posted to the main loop with each decoded scene image
+IMAGE_READY_EVENT = pygame.event.custom_type()
+# Input box that Tab moves to from each input box
+NEXT_INPUT = {"prompt": "character", "character": "setting", "setting": "scenes", "scenes": "prompt"}
+# Label shown beside each input box of the input screen
+INPUT_LABELS = {
+    "prompt": "Story Idea:",
+    "character": "Character (Optional):",
+    "setting": "Setting (Optional):",
+    "scenes": "Number of scenes:"
+}
+# Characters that can be typed into the save dialog's filename
+_VALID_FILENAME_CHARS = frozenset(string.ascii_letters + string.digits + "-_ ")
+# Minimum time between repaints caused by status message updates
+STATUS_REPAINT_INTERVAL_MS = 33
+# Longest the main loop sleeps waiting for an event on screens where nothing animates, so status
+# messages posted from other threads still show up promptly
+IDLE_WAIT_MS = 100
+# The only events SDL queues; everything else (mouse motion above all) is dropped before it reaches
+# Python. TEXTINPUT stays allowed because pygame uses it to fill in KEYDOWN's unicode attribute.
+HANDLED_EVENTS = [
+    pygame.QUIT, pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN, pygame.TEXTINPUT, IMAGE_READY_EVENT,
+    pygame.WINDOWMINIMIZED, pygame.WINDOWRESTORED, pygame.WINDOWSHOWN, pygame.WINDOWMAXIMIZED,
+    pygame.WINDOWEXPOSED
+]
+
 # Debug variables
 DEBUG_MODE = True  # Set to True to enable additional console logging
 
-# Check for required environment variables
-if not os.getenv("FAL_KEY"):
-    logging.error("Error: FAL_KEY environment variable not set")
-    logging.error("Please create a .env file with your FAL_KEY")
-    sys.exit(1)
+# Shared HTTP client for image downloads, both when generating and when loading saved stories.
+# Connections to the FAL CDN are kept alive, so only the first download of a session pays for the
+# TCP and TLS handshakes.
+_HTTP = httpx.Client(
+    transport=httpx.HTTPTransport(
+        retries=HTTP_RETRIES,
+        limits=httpx.Limits(max_connections=HTTP_POOL_SIZE, max_keepalive_connections=HTTP_POOL_SIZE)
+    ),
+    timeout=IMAGE_DOWNLOAD_TIMEOUT,
+    follow_redirects=True
+)
 
-# Create a log file in addition to console output
-if DEBUG_MODE:
-    file_handler = logging.FileHandler('story_generator_debug.log')
-    file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-    logging.getLogger().addHandler(file_handler)
-    logging.debug("Debug mode enabled - Writing logs to story_generator_debug.log")
+def _bootstrap():
+    """
+    Prepare the environment for running the app: load .env, check the FAL key and set up the debug
+    log file. Kept out of module import so the module can be imported without side effects
+    """
+    dotenv.load_dotenv()
+
+    # Check for required environment variables
+    if not os.getenv("FAL_KEY"):
+        logging.error("Error: FAL_KEY environment variable not set")
+        logging.error("Please create a .env file with your FAL_KEY")
+        sys.exit(1)
+
+    # Create a log file in addition to console output
+    if DEBUG_MODE:
+        file_handler = logging.FileHandler('story_generator_debug.log')
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+        # Log records are handed to a queue and written to disk by a listener thread, so generation
+        # and UI threads never block on file I/O
+        log_queue = queue.Queue(-1)
+        logging.getLogger().addHandler(logging.handlers.QueueHandler(log_queue))
+        log_listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+        log_listener.start()
+        atexit.register(log_listener.stop)
+        logging.debug("Debug mode enabled - Writing logs to story_generator_debug.log")
+
+# Image prompts already written for a scene, keyed by (scene_text, character_description)
+_PROMPT_CACHE: Dict[Tuple[str, str], str] = {}
+# FLUX result URLs, keyed by (image_prompt, seed, image width, image height)
+_IMAGE_URL_CACHE: Dict[Tuple[str, int, int, int], str] = {}
+
+# Rendered surfaces for static UI text, keyed by (font, text, color)
+_render_cache = {}
+
+def _cached_render(font, text, color):
+    """Render a static string once and reuse the surface on later frames"""
+    key = (id(font), text, color)
+    surface = _render_cache.get(key)
+    if surface is None:
+        # Converted to the display's pixel format so later blits need no per-pixel conversion
+        surface = font.render(text, True, color).convert_alpha()
+        _render_cache[key] = surface
+    return surface
+
+# Button surfaces with their caption already drawn, keyed by (font, size, background, text, text color)
+_button_cache = {}
+
+def _cached_button(font, size, bg_color, text, text_color):
+    """Compose a filled button and its centered caption once and reuse the surface on later frames"""
+    key = (id(font), size, bg_color, text, text_color)
+    surface = _button_cache.get(key)
+    if surface is None:
+        surface = pygame.Surface(size)
+        surface.fill(bg_color)
+        caption = _cached_render(font, text, text_color)
+        surface.blit(caption, caption.get_rect(center=(size[0]//2, size[1]//2)))
+        _button_cache[key] = surface
+    return surface
 
 class StoryStorage:
     """
@@ -65,7 +286,12 @@ class StoryStorage:
         # Create a stories directory if it doesn't exist
         self.stories_dir = "stories"
         os.makedirs(self.stories_dir, exist_ok=True)
-        logging.debug(f"StoryStorage initialized. Stories directory: {self.stories_dir}")
+        # Metadata of each story file, keyed by filename, with the modification time it was read at
+        self._metadata_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        # The last story listing and the stories directory's modification time when it was made
+        self._list_cache: Optional[List[Dict[str, Any]]] = None
+        self._list_cache_mtime = 0
+        logging.debug("StoryStorage initialized. Stories directory: %s", self.stories_dir)
 
     def save_story(self, 
                    filename: str,
@@ -118,37 +344,35 @@ class StoryStorage:
                 "scenes": []
             }
 
-            # Create scenes metadata
-            for i, (scene_text, image, image_url) in enumerate(zip(story_scenes, generated_images, image_urls)):
-                scene_data = {
-                    "index": i,
-                    "text": scene_text,
-                    "image_file": f"images/scene_{i}.png" if image else None,
-                    "image_url": image_url  # Store the image URL
-                }
-                metadata["scenes"].append(scene_data)
-
-            # Create the ZIP file
-            with zipfile.ZipFile(filepath, 'w') as zip_file:
-                # Add metadata.json
-                zip_file.writestr("metadata.json", json.dumps(metadata, indent=2))
+            # Create the ZIP file. Image data is already compressed, so entries are stored as they are
+            # and only the metadata text is deflated, at the fastest level
+            with zipfile.ZipFile(filepath, 'w', compression=zipfile.ZIP_STORED) as zip_file:
+                # Add each scene's metadata and image in a single pass
+                for i, (scene_text, image, image_url) in enumerate(zip(story_scenes, generated_images, image_urls)):
+                    scene_data = {
+                        "index": i,
+                        "text": scene_text,
+                        "image_file": f"images/scene_{i}.{SAVED_IMAGE_FORMAT}" if image else None,
+                        "image_url": image_url  # Store the image URL
+                    }
+                    metadata["scenes"].append(scene_data)
 
-                # Create images directory
-                zip_file.writestr("images/", "")
-
-                # Add images
-                for i, image in enumerate(generated_images):
                     if image:
-                        # Create an in-memory bytes buffer for the image
-                        img_bytes = io.BytesIO()
-                        # Save the pygame surface as PNG to the buffer
-                        pygame.image.save(image, img_bytes)
-                        img_bytes.seek(0)  # Reset buffer position
-
-                        # Add to zip
-                        zip_file.writestr(f"images/scene_{i}.png", img_bytes.read())
-
-            logging.debug(f"Story saved successfully to {filepath}")
+                        # Save the image straight into the zip entry, as WebP when Pillow is available
+                        with zip_file.open(scene_data["image_file"], 'w') as image_file:
+                            if Image:
+                                Image.frombytes("RGBA", image.get_size(), pygame.image.tostring(image, "RGBA")).save(
+                                    image_file, "WEBP", quality=WEBP_QUALITY, method=4)
+                            else:
+                                pygame.image.save(image, image_file, "PNG")
+
+                # Add metadata.json once every scene has been recorded
+                zip_file.writestr("metadata.json", json.dumps(metadata, indent=2),
+                                  compress_type=zipfile.ZIP_DEFLATED, compresslevel=1)
+
+            self._metadata_cache.pop(filename, None)
+            self._list_cache = None
+            logging.debug("Story saved successfully to %s", filepath)
             return True
 
         except Exception as e:
@@ -187,51 +411,86 @@ class StoryStorage:
 
             with zipfile.ZipFile(filepath, 'r') as zip_file:
                 # Extract metadata
-                if "metadata.json" not in zip_file.namelist():
+                members = set(zip_file.namelist())
+                if "metadata.json" not in members:
                     raise ValueError(f"Invalid story file: metadata.json not found")
 
                 metadata = json.loads(zip_file.read("metadata.json"))
 
-                # Extract scenes in order
-                for scene in sorted(metadata["scenes"], key=lambda x: x["index"]):
-                    # Add scene text
-                    story_scenes.append(scene["text"])
-
-                    # Try to load the image - first from URL if available, then from file
-                    image_url = scene.get("image_url")
+                # Extract scenes in order, reading each scene's image members here; decoding them (and
+                # downloading any that are missing) runs in parallel below
+                scenes = sorted(metadata["scenes"], key=lambda x: x["index"])
+                story_scenes = [scene["text"] for scene in scenes]
+                scene_images = [None] * len(scenes)
+                for i, scene in enumerate(scenes):
                     image_file = scene.get("image_file")
-                    image = None
-
-                    # Try to load from URL first
-                    if image_url:
-                        try:
-                            logging.debug(f"Loading image from URL: {image_url}")
-                            with urllib.request.urlopen(image_url) as response:
-                                img_data = response.read()
-                                img_stream = io.BytesIO(img_data)
-                                image = pygame.image.load(img_stream)
-                        except Exception as e:
-                            logging.error(f"Error loading image from URL: {str(e)}")
-                            # Fall back to local file
-
-                    # If URL failed or wasn't available, try local file
-                    if image is None and image_file and image_file in zip_file.namelist():
-                        try:
-                            img_data = zip_file.read(image_file)
-                            img_stream = io.BytesIO(img_data)
-                            image = pygame.image.load(img_stream)
-                        except Exception as e:
-                            logging.error(f"Error loading image from file: {str(e)}")
-
-                    generated_images.append(image)
-
-            logging.debug(f"Story loaded successfully from {filepath}")
+                    image_data = zip_file.read(image_file) if image_file in members else None
+                    scene_images[i] = (scene, image_data)
+
+            if scene_images:
+                with ThreadPoolExecutor(max_workers=min(MAX_IMAGE_WORKERS, len(scene_images))) as executor:
+                    generated_images = list(executor.map(self._load_scene_image, *zip(*scene_images)))
+
+            logging.debug("Story loaded successfully from %s", filepath)
             return metadata, story_scenes, generated_images
 
         except Exception as e:
             logging.error(f"Error loading story: {str(e)}")
             raise
 
+    def _load_scene_image(self, scene: Dict[str, Any], image_data: Optional[bytes]) -> Optional[pygame.Surface]:
+        """
+        Rebuild one scene's image from the data read out of its story file.
+
+        Args:
+            scene: The scene's metadata entry
+            image_data: The scene's PNG or WebP, if the file has it
+
+        Returns:
+            The image, or None if it can't be loaded from the file or its URL
+        """
+        image = None
+
+        if image_data is not None:
+            try:
+                # The file name tells SDL_image which decoder to use
+                image = pygame.image.load(io.BytesIO(image_data), scene["image_file"])
+            except Exception as e:
+                logging.error(f"Error loading image from file: {str(e)}")
+
+        # If the file was missing or unreadable, download the image again
+        image_url = scene.get("image_url")
+        if image is None and image_url:
+            try:
+                logging.debug("Loading image from URL: %s", image_url)
+                response = _HTTP.get(image_url)
+                response.raise_for_status()
+                image = pygame.image.load(io.BytesIO(response.content))
+            except Exception as e:
+                logging.error(f"Error loading image from URL: {str(e)}")
+
+        return image
+
+    def _read_story_metadata(self, filename: str) -> Optional[Dict[str, Any]]:
+        """
+        Read the metadata of a story file.
+
+        Args:
+            filename: The filename to read (with extension)
+
+        Returns:
+            The story metadata, or None if the file has none or can't be read
+        """
+        try:
+            with zipfile.ZipFile(os.path.join(self.stories_dir, filename), 'r') as zip_file:
+                if "metadata.json" in zip_file.namelist():
+                    metadata = json.loads(zip_file.read("metadata.json"))
+                    metadata["filename"] = filename
+                    return metadata
+        except Exception as e:
+            logging.error(f"Error reading story metadata from {filename}: {str(e)}")
+        return None
+
     def list_saved_stories(self) -> List[Dict[str, Any]]:
         """
         List all saved stories with their metadata.
@@ -239,23 +498,51 @@ class StoryStorage:
         Returns:
             List of dictionaries containing story metadata
         """
+        # Adding, removing or renaming a story changes the directory's modification time; stories
+        # rewritten in place by save_story drop the listing themselves
+        dir_mtime = os.stat(self.stories_dir).st_mtime_ns
+        if self._list_cache is not None and dir_mtime == self._list_cache_mtime:
+            return list(self._list_cache)
+
         stories = []
+        seen = set()
+        changed = []
 
-        for filename in os.listdir(self.stories_dir):
-            if filename.endswith('.story'):
+        with os.scandir(self.stories_dir) as entries:
+            for entry in entries:
+                filename = entry.name
+                if not filename.endswith('.story'):
+                    continue
+                seen.add(filename)
                 try:
-                    filepath = os.path.join(self.stories_dir, filename)
-                    with zipfile.ZipFile(filepath, 'r') as zip_file:
-                        if "metadata.json" in zip_file.namelist():
-                            metadata = json.loads(zip_file.read("metadata.json"))
-                            metadata["filename"] = filename
-                            stories.append(metadata)
+                    # Only reopen the zip if the file changed since its metadata was last read
+                    mtime = entry.stat().st_mtime_ns
+                    cached = self._metadata_cache.get(filename)
+                    if cached and cached[0] == mtime:
+                        stories.append(cached[1])
+                    else:
+                        changed.append((filename, mtime))
                 except Exception as e:
                     logging.error(f"Error reading story metadata from {filename}: {str(e)}")
 
+        # Read the changed files concurrently so their disk reads overlap
+        if changed:
+            with ThreadPoolExecutor(max_workers=min(len(changed), MAX_METADATA_WORKERS)) as executor:
+                results = executor.map(self._read_story_metadata, [filename for filename, _ in changed])
+                for (filename, mtime), metadata in zip(changed, results):
+                    if metadata is not None:
+                        self._metadata_cache[filename] = (mtime, metadata)
+                        stories.append(metadata)
+
+        # Forget stories that are no longer on disk
+        for filename in self._metadata_cache.keys() - seen:
+            del self._metadata_cache[filename]
+
         # Sort by creation date (newest first)
         stories.sort(key=lambda x: x.get("creation_date", ""), reverse=True)
-        return stories
+        self._list_cache = stories
+        self._list_cache_mtime = dir_mtime
+        return list(stories)
 
     def delete_story(self, filename: str) -> bool:
         """
@@ -275,7 +562,9 @@ class StoryStorage:
 
             if os.path.exists(filepath):
                 os.remove(filepath)
-                logging.debug(f"Story deleted: {filepath}")
+                self._metadata_cache.pop(filename, None)
+                self._list_cache = None
+                logging.debug("Story deleted: %s", filepath)
                 return True
             else:
                 logging.warning(f"Story file not found for deletion: {filepath}")
@@ -293,20 +582,137 @@ class AI_Generation:
         self.default_num_scenes = default_num_scenes
         self.status_callback = lambda msg: None  # Default empty callback
         self.image_status_callback = lambda idx, status: None  # Default empty callback
-
-    def set_callbacks(self, status_callback, image_status_callback):
-        """Set callbacks for status updates"""
+        self.scenes_callback = lambda scenes: None  # Default empty callback
+        self.scene_image_callback = lambda idx, image_data, image_url: None  # Default empty callback
+        self.request_semaphore = threading.BoundedSemaphore(MAX_CONCURRENT_FAL_REQUESTS)
+        self._cached_llm = functools.lru_cache(maxsize=LLM_CACHE_SIZE)(self._run_llm)
+        self._streamed_responses = {}
+        # Physical appearance extracted from each character description of the current story
+        self._physical_cache: Dict[str, str] = {}
+        # Image pool workers record the generation thread they work for
+        self._generation = threading.local()
+
+    def set_callbacks(self, status_callback, image_status_callback, scenes_callback=None, scene_image_callback=None):
+        """
+        Set callbacks for status updates, and optionally for results as soon as they are available:
+        scenes_callback receives the scene texts before illustration starts, and
+        scene_image_callback receives (index, image_data, image_url) for each finished image; image_data
+        is None if the story was generated without fetching images
+        """
         self.status_callback = status_callback
         self.image_status_callback = image_status_callback
+        if scenes_callback:
+            self.scenes_callback = scenes_callback
+        if scene_image_callback:
+            self.scene_image_callback = scene_image_callback
+
+    def current_generation(self):
+        """
+        Return the generation thread the calling thread works for: the thread that started its image pool,
+        or the calling thread itself
+        """
+        return getattr(self._generation, "thread", threading.current_thread())
+
+    def _join_generation(self, generation):
+        """Image pool initializer recording the generation thread a worker works for"""
+        self._generation.thread = generation
 
     def on_queue_update(self, update, scene_index=None):
         """Callback function for FAL API queue updates"""
         if hasattr(update, 'logs') and update.logs:
             for log in update.logs:
                 if scene_index is not None:
-                    logging.debug(f"FAL API (Scene {scene_index+1}) update: {log.get('message', '')}")
+                    logging.debug("FAL API (Scene %s) update: %s", scene_index+1, log.get('message', ''))
                 else:
-                    logging.debug(f"FAL API update: {log.get('message', '')}")
+                    logging.debug("FAL API update: %s", log.get('message', ''))
+
+    def _subscribe(self, application, arguments, on_queue_update=None):
+        """Call a FAL application, holding the request semaphore for the duration of the call"""
+        with self.request_semaphore:
+            return fal_client.subscribe(
+                application,
+                arguments=arguments,
+                with_logs=True,
+                on_queue_update=on_queue_update or self.on_queue_update
+            )
+
+    def _run_llm(self, model, system_prompt, prompt, max_tokens=LLM_MAX_TOKENS):
+        """Run a single text generation request through FAL AI any-llm"""
+        result = self._subscribe(
+            "fal-ai/any-llm",
+            arguments={
+                "model": model,
+                "system_prompt": system_prompt,
+                "prompt": prompt,
+                "max_tokens": max_tokens
+            }
+        )
+        return result["output"]
+
+    def _call_llm(self, system_prompt, prompt):
+        """Generate text with the story LLM, reusing the cached response for an identical request"""
+        return self._cached_llm(STORY_LLM_MODEL, system_prompt, prompt)
+
+    def _stream_llm(self, system_prompt, prompt, on_partial):
+        """
+        Generate text with the story LLM, passing the response received so far to on_partial as it
+        streams in. Completed responses are kept, so an identical request is answered at once
+        """
+        key = (STORY_LLM_MODEL, system_prompt, prompt)
+        output = self._streamed_responses.get(key)
+        if output is not None:
+            on_partial(output)
+            return output
+
+        output = ""
+        with self.request_semaphore:
+            for event in fal_client.stream(
+                "fal-ai/any-llm",
+                arguments={
+                    "model": STORY_LLM_MODEL,
+                    "system_prompt": system_prompt,
+                    "prompt": prompt,
+                    "max_tokens": LLM_MAX_TOKENS
+                }
+            ):
+                # Each event carries the whole output generated so far
+                if event.get("output"):
+                    output = event["output"]
+                    on_partial(output)
+
+        self._streamed_responses[key] = output
+        if len(self._streamed_responses) > LLM_CACHE_SIZE:
+            del self._streamed_responses[next(iter(self._streamed_responses))]
+        return output
+
+    def fetch_image_bytes(self, image_url):
+        """
+        Download an image into memory over the shared connection pool. When the server reports
+        Content-Length the body is copied into a buffer allocated once at that size.
+        """
+        with _HTTP.stream("GET", image_url) as response:
+            response.raise_for_status()
+            length = int(response.headers.get('Content-Length') or 0)
+            if not length:
+                return response.read()
+
+            buffer = bytearray(length)
+            received = 0
+            for chunk in response.iter_bytes(DOWNLOAD_CHUNK_SIZE):
+                buffer[received:received + len(chunk)] = chunk
+                received += len(chunk)
+            return buffer if received == len(buffer) else buffer[:received]
+
+    def warm_up(self):
+        """
+        Send a trivial LLM request so the FAL client, its credentials and its connection to the
+        queue are ready before the first real story request
+        """
+        try:
+            self._run_llm(STORY_LLM_MODEL, "Reply with the single word OK.", "OK", max_tokens=1)
+            logging.debug("AI generation warm-up complete")
+        except Exception as e:
+            logging.debug("AI generation warm-up failed: %s", e)
 
     def generate_story_rough_sketch(self, user_prompt, genre, tone, num_scenes, user_character_desc=None, user_setting_desc=None):
         """
@@ -316,15 +722,14 @@ class AI_Generation:
         try:
             self.status_callback(f"Creating a {num_scenes}-scene {genre} story sketch...")
 
-            logging.debug(f"=== GENERATING STORY ROUGH SKETCH ===")
-            logging.debug(f"User prompt: '{user_prompt}'")
-            logging.debug(f"Genre: {genre}, Tone: {tone}, Scenes: {num_scenes}")
+            logging.debug("=== GENERATING STORY ROUGH SKETCH ===")
+            logging.debug("User prompt: '%s'", user_prompt)
+            logging.debug("Genre: %s, Tone: %s, Scenes: %s", genre, tone, num_scenes)
 
-            # Construct the prompt for story sketch generation
+            # Construct the request-specific part of the sketch prompt
             sketch_prompt = f"""
             Create a rough sketch for a {num_scenes}-scene {genre} story with a {tone.lower()} tone based on this idea: 
             "{user_prompt}"
-
             """
 
             # Add optional character/setting info if provided
@@ -334,29 +739,9 @@ class AI_Generation:
             if user_setting_desc:
                 sketch_prompt += f"\nThe story is set in: {user_setting_desc}\n"
 
-            sketch_prompt += f"""
-            Your response should include:
-            1. A brief story synopsis (2-3 sentences)
-            2. Main plot points for a {num_scenes}-scene structure
-            3. Key themes or motifs
-            4. Critical story elements (items, places, events)
-
-            Format your response in clear sections with headers. Keep the entire response under 400 words.
-            """
-
             # Call FAL AI any-llm API with GPT-4o model
-            result = fal_client.subscribe(
-                "fal-ai/any-llm",
-                arguments={
-                    "model": "openai/gpt-4o",
-                    "prompt": sketch_prompt
-                },
-                with_logs=True,
-                on_queue_update=self.on_queue_update
-            )
-
-            story_sketch = result["output"]
-            logging.debug(f"=== STORY SKETCH GENERATED ===\n{story_sketch[:300]}...\n")
+            story_sketch = self._call_llm(SKETCH_SYSTEM_PROMPT, sketch_prompt)
+            logging.debug("=== STORY SKETCH GENERATED ===\n%.300s...\n", story_sketch)
 
             return story_sketch
 
@@ -373,7 +758,7 @@ class AI_Generation:
         try:
             self.status_callback("Creating detailed character profile...")
 
-            logging.debug(f"=== GENERATING CHARACTER DESCRIPTION ===")
+            logging.debug("=== GENERATING CHARACTER DESCRIPTION ===")
 
             # Construct the prompt for character generation
             character_prompt = f"""
@@ -388,59 +773,158 @@ class AI_Generation:
                 character_prompt += f"""
                 ADDITIONAL CHARACTER INFORMATION FROM USER:
                 {user_character_desc}
-
-                Incorporate these details into your character profile.
                 """
 
-            character_prompt += """
-            Create a comprehensive character profile including:
-
-            1. PHYSICAL APPEARANCE: Age, gender, distinguishing features, style of dress, and other visual characteristics that would be important for illustration.
+            # Call FAL AI any-llm API with GPT-4o model
+            character_description = self._call_llm(CHARACTER_SYSTEM_PROMPT, character_prompt)
+            logging.debug("=== CHARACTER DESCRIPTION GENERATED ===\n%.300s...\n", character_description)
 
-            2. PERSONALITY: Key personality traits, values, fears, desires, and quirks that define this character.
+            return character_description
 
-            3. BACKGROUND: Brief relevant backstory elements that influence the character's actions in this story.
+        except Exception as e:
+            logging.error(f"Error generating character description: {str(e)}")
+            self.status_callback(f"Error generating character description: {str(e)}")
+            return ""
 
-            4. RELATIONSHIPS: Important connections to other characters or entities in the story.
+    def _parse_scenes(self, scene_text, verbose=True):
+        """
+        Split a scene response into scene texts and their image prompts.
+        Returns a tuple of (scenes, image_prompts); an image prompt is None if the model omitted it.
+        Pass verbose=False to skip the per-line debug output, e.g. for partial streamed responses
+        """
+        scenes = []
+        image_prompts = []
+        # Lines of the scene and image prompt being read, joined once each is complete
+        scene_parts = []
+        prompt_parts = []
+        scene_started = False
+        in_image_prompt = False
+
+        # Checked once so the per-line debug output costs nothing when DEBUG is off
+        debug_enabled = verbose and logging.getLogger().isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            logging.debug("Starting to parse scenes from response...")
+        # Bound once: streamed responses are re-parsed on every chunk
+        match_scene = _SCENE_RE.match
+        match_image_prompt = _IMAGE_PROMPT_RE.match
+        for line in scene_text.splitlines():
+            line = line.strip()
+
+            # Check for scene markers like "SCENE 1:" or "SCENE 1"
+            scene_match = match_scene(line)
+            image_prompt_match = None if scene_match else match_image_prompt(line)
+            if scene_match:
+                if debug_enabled:
+                    logging.debug("Found scene marker: '%s'", line)
+                self._finish_scene(scenes, image_prompts, scene_parts, prompt_parts, debug_enabled)
+                scene_parts = [scene_match.group(2).strip()]
+                prompt_parts = []
+                scene_started = True
+                in_image_prompt = False
+            # The image prompt follows the scene text it illustrates
+            elif scene_started and image_prompt_match:
+                prompt_parts = [image_prompt_match.group(2).strip()]
+                in_image_prompt = True
+            # If we're in a scene and this isn't a new marker, add the line to the current scene or prompt
+            elif scene_started and line:
+                (prompt_parts if in_image_prompt else scene_parts).append(line)
+
+        # Add the last scene if there is one
+        self._finish_scene(scenes, image_prompts, scene_parts, prompt_parts, debug_enabled)
+        return scenes, image_prompts
+
+    def _finish_scene(self, scenes, image_prompts, scene_parts, prompt_parts, debug_enabled):
+        """Append a fully read scene and its image prompt (None if it had none) to the parsed lists"""
+        scene = " ".join(scene_parts).strip()
+        if not scene:
+            return
+        if debug_enabled:
+            logging.debug("Adding scene: '%.50s...'", scene)
+        scenes.append(scene)
+        image_prompts.append(" ".join(prompt_parts).strip() or None)
+
+    def _fit_scenes(self, scenes, image_prompts, num_scenes):
+        """Pad or trim parsed scenes and their image prompts to the requested number of scenes"""
+        # Ensure we have the requested number of scenes
+        missing = num_scenes - len(scenes)
+        if missing > 0:
+            logging.warning("Not enough scenes parsed, adding placeholders for scenes %d-%d", len(scenes) + 1, num_scenes)
+            scenes.extend([f"Scene {i+1} description not available." for i in range(len(scenes), num_scenes)])
+            image_prompts.extend([None] * missing)
+
+        logging.debug("=== PARSED SCENES ===")
+        for i, scene in enumerate(scenes[:num_scenes]):
+            logging.debug("Scene %s: %.100s...", i+1, scene)
+
+        # Limit to requested number of scenes
+        return scenes[:num_scenes], image_prompts[:num_scenes]
+
+    def generate_story_combined(self, user_prompt, genre, tone, num_scenes, user_character_desc=None, user_setting_desc=None, on_scene=None):
+        """
+        Generate the story sketch, character description and scenes with a single LLM request.
+        on_scene is used as in generate_story_scenes.
+        Returns a tuple of (story_sketch, character_description, scenes, image_prompts), or None if the
+        response could not be split into its sections
+        """
+        try:
+            self.status_callback(f"Writing a {num_scenes}-scene {genre} story...")
 
-            5. GROWTH ARC: How this character might change throughout the story.
+            logging.debug("=== GENERATING COMBINED STORY ===")
+            logging.debug("User prompt: '%s'", user_prompt)
+            logging.debug("Genre: %s, Tone: %s, Scenes: %s", genre, tone, num_scenes)
 
-            Format this as a clear profile that can be referenced when creating story scenes and illustrations. Be specific and visual where possible.
+            # Construct the request-specific part of the story prompt
+            story_prompt = f"""
+            Write a {num_scenes}-scene {genre} story with a {tone.lower()} tone based on this idea: 
+            "{user_prompt}"
             """
 
+            # Add optional character/setting info if provided
+            if user_character_desc:
+                story_prompt += f"\nThe main character is described as: {user_character_desc}\n"
+
+            if user_setting_desc:
+                story_prompt += f"\nThe story is set in: {user_setting_desc}\n"
+
             # Call FAL AI any-llm API with GPT-4o model
-            result = fal_client.subscribe(
-                "fal-ai/any-llm",
-                arguments={
-                    "model": "openai/gpt-4o",
-                    "prompt": character_prompt
-                },
-                with_logs=True,
-                on_queue_update=self.on_queue_update
-            )
+            if on_scene:
+                story_text = self._stream_scenes(COMBINED_SYSTEM_PROMPT, story_prompt, num_scenes, on_scene)
+            else:
+                story_text = self._call_llm(COMBINED_SYSTEM_PROMPT, story_prompt)
+            logging.debug("=== RAW STORY RESPONSE ===\n%.500s...\n=== END RAW RESPONSE ===", story_text)
 
-            character_description = result["output"]
-            logging.debug(f"=== CHARACTER DESCRIPTION GENERATED ===\n{character_description[:300]}...\n")
+            sections = self._split_sections(story_text)
+            story_sketch = sections.get("STORY SKETCH", "")
+            character_description = sections.get("CHARACTER PROFILE", "")
+            scenes, image_prompts = self._parse_scenes(sections.get("SCENES", ""))
 
-            return character_description
+            if not (character_description and scenes):
+                logging.warning("Combined story response is missing its character profile or scenes")
+                return None
+
+            scenes, image_prompts = self._fit_scenes(scenes, image_prompts, num_scenes)
+            return story_sketch, character_description, scenes, image_prompts
 
         except Exception as e:
-            logging.error(f"Error generating character description: {str(e)}")
-            self.status_callback(f"Error generating character description: {str(e)}")
-            return ""
+            logging.error(f"Error generating combined story: {str(e)}")
+            return None
 
-    def generate_story_scenes(self, story_sketch, character_description, num_scenes):
+    def generate_story_scenes(self, story_sketch, character_description, num_scenes, on_scene=None):
         """
         PROMPT TYPE THREE:
-        Generate detailed scenes based on the story sketch, character description, and number of scenes
+        Generate detailed scenes based on the story sketch, character description, and number of scenes.
+        Each scene is written together with its illustration prompt so no separate prompt rewrite is needed.
+        If on_scene is given the response is streamed, and on_scene(index, scene, image_prompt, character_description)
+        is called for each scene as soon as the next scene marker shows that it is complete.
+        Returns a tuple of (scenes, image_prompts); an image prompt is None if the model omitted it
         """
         try:
             self.status_callback(f"Developing {num_scenes} detailed story scenes...")
 
-            logging.debug(f"=== GENERATING STORY SCENES ===")
-            logging.debug(f"Number of scenes: {num_scenes}")
+            logging.debug("=== GENERATING STORY SCENES ===")
+            logging.debug("Number of scenes: %s", num_scenes)
 
-            # Construct the prompt for scene generation
+            # Construct the request-specific part of the scene prompt
             scene_prompt = f"""
             Create {num_scenes} detailed, coherent scenes for a story based on the following story sketch and character profile:
 
@@ -449,118 +933,137 @@ class AI_Generation:
 
             CHARACTER PROFILE:
             {character_description}
+            """
 
-            Format your response exactly as follows:
-
-            SCENE 1: [Vivid, detailed description of the first scene. Make it highly visual and descriptive, focusing on the character's experience.]
+            # Call FAL AI any-llm API with GPT-4o model
+            if on_scene:
+                scene_text = self._stream_scenes(SCENE_SYSTEM_PROMPT, scene_prompt, num_scenes, on_scene, character_description)
+            else:
+                scene_text = self._call_llm(SCENE_SYSTEM_PROMPT, scene_prompt)
+            logging.debug("=== RAW SCENE RESPONSE ===\n%.500s...\n=== END RAW RESPONSE ===", scene_text)
 
-            SCENE 2: [Vivid, detailed description of the second scene that builds from the first. Again, make it visual and incorporate character details.]
-            """
+            scenes, image_prompts = self._parse_scenes(scene_text)
+            return self._fit_scenes(scenes, image_prompts, num_scenes)
 
-            # Add placeholders for the remaining scenes
-            for i in range(3, num_scenes + 1):
-                scene_prompt += f"""
+        except Exception as e:
+            logging.error(f"Error generating story scenes: {str(e)}")
+            self.status_callback(f"Error generating story scenes: {str(e)}")
+            return [], []
+
+    def _split_sections(self, text):
+        """Split a combined story response into its sections, keyed by header name"""
+        headers = list(_SECTION_RE.finditer(text))
+        sections = {}
+        for i, header in enumerate(headers):
+            end = headers[i + 1].start() if i + 1 < len(headers) else len(text)
+            sections[header.group(1)] = text[header.end():end].strip()
+        return sections
+
+    def _stream_scenes(self, system_prompt, prompt, num_scenes, on_scene, character_description=None):
+        """
+        Stream a response containing scenes, handing each completed scene to
+        on_scene(index, scene, image_prompt, character_description) before the rest of the response
+        has arrived. Without a character_description the response is a combined story, and the
+        character profile and scenes are read from its sections. Falls back to a regular request if
+        streaming fails before any scene was handed out. Returns the full response text
+        """
+        emitted = 0
+        marker_count = 0
+
+        def on_partial(text):
+            nonlocal emitted, marker_count
+            # Only re-parse once a new scene marker has arrived with its number, as parsing needs both
+            count = len(_SCENE_MARKER_RE.findall(text))
+            if count == marker_count:
+                return
+            marker_count = count
+
+            character = character_description
+            if character is None:
+                # The character profile is complete once the scenes section has started
+                sections = self._split_sections(text)
+                character = sections.get("CHARACTER PROFILE")
+                text = sections.get("SCENES")
+                if not (character and text):
+                    return
 
-                SCENE {i}: [Vivid, detailed description of scene {i} that advances the story. Make it visual and ensure character continuity.]
-                """
+            # Every scene but the last one parsed is followed by another marker, so it is complete
+            scenes, image_prompts = self._parse_scenes(text, verbose=False)
+            while emitted < min(len(scenes) - 1, num_scenes):
+                on_scene(emitted, scenes[emitted], image_prompts[emitted], character)
+                emitted += 1
 
-            scene_prompt += """
+        try:
+            return self._stream_llm(system_prompt, prompt, on_partial)
+        except Exception as e:
+            if emitted:
+                raise
+            logging.warning(f"Streaming scenes failed, retrying without streaming: {str(e)}")
+            return self._call_llm(system_prompt, prompt)
 
-            Keep each scene description between 100-150 words. Make each scene visually distinctive and memorable, perfect for illustration. Ensure the character remains consistent throughout all scenes, and that the narrative builds logically from one scene to the next.
-            """
+    def generate_image_prompts(self, scenes, character_description):
+        """
+        Write image prompts for several scenes with a single LLM request.
+        scenes maps scene index to scene text; returns a dict of scene index to image prompt
+        for the scenes the model answered
+        """
+        try:
+            logging.debug("=== WRITING IMAGE PROMPTS FOR %s SCENES ===", len(scenes))
 
-            # Call FAL AI any-llm API with GPT-4o model
-            result = fal_client.subscribe(
-                "fal-ai/any-llm",
-                arguments={
-                    "model": "openai/gpt-4o",
-                    "prompt": scene_prompt
-                },
-                with_logs=True,
-                on_queue_update=self.on_queue_update
-            )
+            numbered_scenes = "\n\n".join(f"SCENE {i+1}: {text}" for i, text in scenes.items())
+            prompt = f"""
+            CHARACTER PROFILE:
+            {character_description}
 
-            scene_text = result["output"]
-            logging.debug(f"=== RAW SCENE RESPONSE ===\n{scene_text[:500]}...\n=== END RAW RESPONSE ===")
+            SCENES:
+            {numbered_scenes}
+            """
 
-            # Parse scenes
-            scenes = []
-            current_scene = ""
-            scene_started = False
+            response = self._call_llm(IMAGE_PROMPT_SYSTEM_PROMPT, prompt)
 
-            logging.debug(f"Starting to parse scenes from response...")
-            for line in scene_text.split('\n'):
+            # Collect each numbered prompt, including any continuation lines
+            prompts = {}
+            current_index = None
+            for line in response.splitlines():
                 line = line.strip()
-                logging.debug(f"Parsing line: '{line[:50]}...' if longer")
-
-                # Check for scene markers like "SCENE 1:" or "SCENE 1"
-                if re.search(r'SCENE\s+\d+:?', line):
-                    logging.debug(f"Found scene marker: '{line}'")
-                    if scene_started and current_scene:
-                        logging.debug(f"Adding previous scene: '{current_scene[:50]}...'")
-                        scenes.append(current_scene.strip())
-                    current_scene = line.split(':', 1)[1].strip() if ':' in line else ""
-                    scene_started = True
-                # If we're in a scene and this isn't a new scene marker, add the line to the current scene
-                elif scene_started and line:
-                    current_scene += " " + line
-
-            # Add the last scene if there is one
-            if scene_started and current_scene:
-                logging.debug(f"Adding final scene: '{current_scene[:50]}...'")
-                scenes.append(current_scene.strip())
-
-            # Ensure we have the requested number of scenes
-            while len(scenes) < num_scenes:
-                logging.warning(f"Not enough scenes parsed, adding placeholder for scene {len(scenes)+1}")
-                scenes.append(f"Scene {len(scenes)+1} description not available.")
-
-            logging.debug(f"=== PARSED SCENES ===")
-            for i, scene in enumerate(scenes[:num_scenes]):
-                logging.debug(f"Scene {i+1}: {scene[:100]}...")
-
-            return scenes[:num_scenes]  # Limit to requested number of scenes
+                match = _IMAGE_PROMPT_RE.match(line)
+                if match and match.group(1):
+                    current_index = int(match.group(1)) - 1
+                    prompts[current_index] = match.group(2).strip()
+                elif current_index is not None and line:
+                    prompts[current_index] += " " + line
+
+            return {i: prompt for i, prompt in prompts.items() if i in scenes and prompt}
 
         except Exception as e:
-            logging.error(f"Error generating story scenes: {str(e)}")
-            self.status_callback(f"Error generating story scenes: {str(e)}")
-            return []
+            logging.error(f"Error writing image prompts: {str(e)}")
+            return {}
 
     def generate_image_prompt(self, scene_text, scene_index, character_description):
         """
         Use the video prompt generator to create an enhanced image prompt that includes character details
         """
         try:
-            logging.debug(f"=== ENHANCING IMAGE PROMPT FOR SCENE {scene_index+1} ===")
-            logging.debug(f"Scene text: {scene_text[:100]}...")
-
-            # Extract key physical details from character description
-            character_physical = ""
-            char_desc_lines = character_description.split('\n')
-            in_physical_section = False
-
-            for line in char_desc_lines:
-                if "PHYSICAL APPEARANCE" in line:
-                    in_physical_section = True
-                    continue
-                elif any(section in line for section in ["PERSONALITY", "BACKGROUND", "RELATIONSHIPS", "GROWTH"]):
-                    in_physical_section = False
-                elif in_physical_section and line.strip():
-                    character_physical += line.strip() + " "
-
-            # Create a scene-specific queue update callback
-            def on_queue_update_for_video_prompt(update):
-                self.on_queue_update(update, scene_index)
-
-            # Prepare the input concept combining scene and character details
+            logging.debug("=== ENHANCING IMAGE PROMPT FOR SCENE %s ===", scene_index+1)
+            logging.debug("Scene text: %.100s...", scene_text)
+
+            # Extract key physical details from character description, once per story
+            character_physical = self._physical_cache.get(character_description)
+            if character_physical is None:
+                physical_match = _PHYSICAL_RE.search(character_description)
+                character_physical = " ".join(physical_match.group(1).split()) if physical_match else ""
+                self._physical_cache[character_description] = character_physical
+
+            # Prepare the input concept combining character and scene details; the character part is
+            # shared by every scene of the story, so it goes first and the scene text last
             input_concept = f"""
-            Scene description: {scene_text}
-
             Main character appearance: {character_physical}
+
+            Scene description: {scene_text}
             """
 
             # Call FAL AI video prompt generator
-            result = fal_client.subscribe(
+            result = self._subscribe(
                 "fal-ai/video-prompt-generator",
                 arguments={
                     "input_concept": input_concept,
@@ -570,142 +1073,225 @@ class AI_Generation:
                     "prompt_length": "Medium",  # Medium length for balance between detail and conciseness
                     "model": "google/gemini-flash-1.5"  # Using default model for speed
                 },
-                with_logs=True,
-                on_queue_update=on_queue_update_for_video_prompt
+                on_queue_update=functools.partial(self.on_queue_update, scene_index=scene_index)
             )
 
             enhanced_prompt = result["prompt"]
-            logging.debug(f"Enhanced image prompt: {enhanced_prompt}")
+            logging.debug("Enhanced image prompt: %s", enhanced_prompt)
             return enhanced_prompt
 
         except Exception as e:
             logging.error(f"Error enhancing image prompt, falling back to original: {str(e)}")
             return scene_text  # Fallback to original scene text
 
-    def generate_image(self, scene_text, scene_index, character_description):
+    def generate_image_url(self, scene_text, scene_index, character_description, image_prompt=None):
         """
         PROMPT TYPE FOUR:
-        Generate an image for a scene incorporating character details
-        Returns a tuple of (image_data, image_url)
+        Generate an image for a scene incorporating character details.
+        Uses image_prompt when the scene generator provided one, otherwise enhances the scene text.
+        Returns the URL of the generated image, or None if generation failed
         """
+        # Generate enhanced image prompt with character details, unless one was written with the scene
+        # or this scene has been illustrated before
+        prompt_key = (scene_text, character_description)
+        if image_prompt:
+            logging.debug("Using image prompt written with scene %s", scene_index+1)
+        elif prompt_key in _PROMPT_CACHE:
+            logging.debug("Using cached image prompt for scene %s", scene_index+1)
+            image_prompt = _PROMPT_CACHE[prompt_key]
+        else:
+            image_prompt = self.generate_image_prompt(scene_text, scene_index, character_description)
+        if image_prompt != scene_text:
+            _PROMPT_CACHE[prompt_key] = image_prompt
+
+        # Call FAL API to generate image
         try:
-            self.status_callback(f"Generating image {scene_index+1}...")
-            self.image_status_callback(scene_index, True)  # Mark as loading
+            logging.debug("Calling FAL AI FLUX with prompt: %.100s...", image_prompt)
+            logging.debug("Image dimensions: %s", IMG_DIM)
+
+            # The same prompt and seed produce the same image, so reuse an earlier result
+            seed = 42 + scene_index  # Use different seeds for variation
+            result_key = (image_prompt, seed, IMG_DIM["width"], IMG_DIM["height"])
+            image_url = _IMAGE_URL_CACHE.get(result_key)
+            if image_url:
+                logging.debug("Using cached image URL for scene %s", scene_index+1)
+                return image_url
+
+            result = self._subscribe(
+                "fal-ai/flux/schnell",
+                arguments={
+                    "prompt": image_prompt,
+                    "image_size": IMG_DIM,
+                    "num_inference_steps": 4,
+                    "seed": seed
+                },
+                on_queue_update=functools.partial(self.on_queue_update, scene_index=scene_index)
+            )
 
-            logging.debug(f"=== STARTING IMAGE GENERATION FOR SCENE {scene_index+1} ===")
+            logging.debug("FAL AI response received:")
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug("%.500s...", json.dumps(result, indent=2, default=str))
 
-            # Generate enhanced image prompt with character details
-            image_prompt = self.generate_image_prompt(scene_text, scene_index, character_description)
+            if not (result and 'images' in result and len(result['images']) > 0):
+                logging.error(f"No images returned in the FAL AI response")
+                return None
 
-            # Call FAL API to generate image
-            try:
-                logging.debug(f"Calling FAL AI FLUX with prompt: {image_prompt[:100]}...")
-                logging.debug(f"Image dimensions: {IMG_DIM}")
-
-                # Create a scene-specific queue update callback
-                def on_queue_update_for_scene(update):
-                    self.on_queue_update(update, scene_index)
-
-                result = fal_client.subscribe(
-                    "fal-ai/flux/schnell",
-                    arguments={
-                        "prompt": image_prompt,
-                        "image_size": IMG_DIM,
-                        "num_inference_steps": 4,
-                        "seed": 42 + scene_index  # Use different seeds for variation
-                    },
-                    with_logs=True,
-                    on_queue_update=on_queue_update_for_scene
-                )
+            image_url = result['images'][0]['url']
+            logging.debug("Image URL: %s", image_url)
+            _IMAGE_URL_CACHE[result_key] = image_url
+            return image_url
 
-                logging.debug(f"FAL AI response received:")
-                logging.debug(json.dumps(result, indent=2, default=str)[:500] + "...")
+        except Exception as e:
+            logging.error(f"Error generating image {scene_index+1}: {str(e)}")
+            self.status_callback(f"Error generating image {scene_index+1}: {str(e)}")
+            return None
 
-                # Process image
-                if result and 'images' in result and len(result['images']) > 0:
-                    image_url = result['images'][0]['url']
-                    logging.debug(f"Image URL: {image_url}")
+    def generate_image(self, scene_text, scene_index, character_description, image_prompt=None, fetch=True):
+        """
+        Generate an image for a scene and, if fetch is set, download it for immediate display.
+        Returns a tuple of (image_data, image_url); image_data is None when fetch is not set
+        """
+        try:
+            self.status_callback(f"Generating image {scene_index+1}...")
+            self.image_status_callback(scene_index, True)  # Mark as loading
 
-                    # Download image for immediate display
-                    logging.debug(f"Downloading image...")
-                    with urllib.request.urlopen(image_url) as response:
-                        image_data = response.read()
+            logging.debug("=== STARTING IMAGE GENERATION FOR SCENE %s ===", scene_index+1)
 
-                    # Return both the image data and the URL
-                    logging.debug(f"Image {scene_index+1} successfully downloaded")
-                    return (image_data, image_url)
-                else:
-                    logging.error(f"No images returned in the FAL AI response")
-                    return (None, None)
+            image_url = self.generate_image_url(scene_text, scene_index, character_description, image_prompt)
+            if not image_url or not fetch:
+                return (None, image_url)
 
-            except Exception as e:
-                logging.error(f"Error generating image {scene_index+1}: {str(e)}")
-                self.status_callback(f"Error generating image {scene_index+1}: {str(e)}")
-                return (None, None)
+            # Download image for immediate display
+            logging.debug("Downloading image...")
+            image_data = self.fetch_image_bytes(image_url)
+
+            # Return both the image data and the URL
+            logging.debug("Image %s successfully downloaded", scene_index+1)
+            return (image_data, image_url)
 
         except Exception as e:
             logging.error(f"Error in generate_image: {str(e)}")
             return (None, None)
         finally:
             self.image_status_callback(scene_index, False)  # Mark as done loading
-            logging.debug(f"=== COMPLETED IMAGE GENERATION FOR SCENE {scene_index+1} ===")
+            logging.debug("=== COMPLETED IMAGE GENERATION FOR SCENE %s ===", scene_index+1)
 
-    def generate_complete_story(self, user_prompt, genre, tone, num_scenes=None, user_character_desc=None, user_setting_desc=None, art_style=None):
+    def generate_complete_story(self, user_prompt, genre, tone, num_scenes=None, user_character_desc=None, user_setting_desc=None, art_style=None, fetch_images=True):
         """
-        Generate a full story with images using the four-step process
+        Generate a full story with images. The text is written with a single combined request, falling
+        back to the separate sketch, character and scene steps if its response cannot be used.
+        Without fetch_images only the image URLs are returned, and the caller downloads the images it
+        needs with fetch_image_bytes
         """
         if num_scenes is None:
             num_scenes = self.default_num_scenes
+        self._physical_cache.clear()
 
         try:
-            # Step 1: Generate the story rough sketch
-            self.status_callback("Step 1/4: Creating story outline...")
-            story_sketch = self.generate_story_rough_sketch(
-                user_prompt, 
-                genre, 
-                tone, 
-                num_scenes, 
-                user_character_desc, 
-                user_setting_desc
-            )
-
-            if not story_sketch:
-                return [], [], []
-
-            # Step 2: Generate detailed character description
-            self.status_callback("Step 2/4: Developing character profile...")
-            character_description = self.generate_character_description(
-                story_sketch, 
-                user_character_desc
-            )
-
-            if not character_description:
-                return [], [], []
-
-            # Step 3: Generate story scenes
-            self.status_callback("Step 3/4: Creating story scenes...")
-            story_scenes = self.generate_story_scenes(
-                story_sketch, 
-                character_description, 
-                num_scenes
-            )
-
-            if not story_scenes:
-                return [], [], []
-
-            # Step 4: Generate images for each scene
-            self.status_callback("Step 4/4: Illustrating scenes...")
-            image_data_list = [None] * len(story_scenes)
-            image_url_list = [None] * len(story_scenes)
-
-            for i, scene in enumerate(story_scenes):
-                image_result = self.generate_image(scene, i, character_description)
-                if image_result:
-                    image_data, image_url = image_result
-                    image_data_list[i] = image_data
-                    image_url_list[i] = image_url
+            # Scenes are independent and network-bound, so generate their images concurrently. The pool is
+            # open while the scenes are written, so a scene is illustrated as soon as its text is complete.
+            # Its workers report progress on behalf of this thread, so the UI can tell which story it belongs to
+            with ThreadPoolExecutor(max_workers=min(max(num_scenes, 1), MAX_IMAGE_WORKERS),
+                                    initializer=self._join_generation,
+                                    initargs=(threading.current_thread(),)) as executor:
+                futures = {}
+
+                def submit_image(i, scene, image_prompt, character):
+                    futures[executor.submit(self.generate_image, scene, i, character, image_prompt, fetch_images)] = i
+
+                def submit_streamed_scene(i, scene, image_prompt, character):
+                    # Scenes without a prompt wait for the batched prompt request below
+                    if image_prompt:
+                        submit_image(i, scene, image_prompt, character)
+
+                # Steps 1-3 in a single request: story outline, character profile and scenes
+                self.status_callback("Step 1/4: Writing the story outline, characters and scenes...")
+                combined = self.generate_story_combined(
+                    user_prompt,
+                    genre,
+                    tone,
+                    num_scenes,
+                    user_character_desc,
+                    user_setting_desc,
+                    on_scene=submit_streamed_scene
+                )
 
-            logging.debug(f"=== STORY AND IMAGE GENERATION COMPLETE ===")
+                if combined:
+                    story_sketch, character_description, story_scenes, image_prompts = combined
+                else:
+                    # Images started for a response that could not be used are abandoned
+                    for future in futures:
+                        future.cancel()
+                    futures.clear()
+
+                    # Step 1: Generate the story rough sketch
+                    self.status_callback("Step 1/4: Creating story outline...")
+                    story_sketch = self.generate_story_rough_sketch(
+                        user_prompt, 
+                        genre, 
+                        tone, 
+                        num_scenes, 
+                        user_character_desc, 
+                        user_setting_desc
+                    )
+
+                    if not story_sketch:
+                        return [], [], []
+
+                    # Step 2: Generate detailed character description
+                    self.status_callback("Step 2/4: Developing character profile...")
+                    character_description = self.generate_character_description(
+                        story_sketch, 
+                        user_character_desc
+                    )
+
+                    if not character_description:
+                        return [], [], []
+
+                    # Step 3: Generate story scenes
+                    self.status_callback("Step 3/4: Creating story scenes...")
+                    story_scenes, image_prompts = self.generate_story_scenes(
+                        story_sketch, 
+                        character_description, 
+                        num_scenes,
+                        on_scene=submit_streamed_scene
+                    )
+
+                if not story_scenes:
+                    return [], [], []
+
+                self.scenes_callback(story_scenes)
+
+                # Write any image prompts the scene step left out in one request rather than one per scene
+                submitted = set(futures.values())
+                missing_prompts = {
+                    i: scene for i, scene in enumerate(story_scenes)
+                    if i not in submitted and not image_prompts[i]
+                }
+                if missing_prompts:
+                    for i, image_prompt in self.generate_image_prompts(missing_prompts, character_description).items():
+                        image_prompts[i] = image_prompt
+
+                # Step 4: Generate images for each scene
+                self.status_callback("Step 4/4: Illustrating scenes...")
+                image_data_list = [None] * len(story_scenes)
+                image_url_list = [None] * len(story_scenes)
+
+                for i, scene in enumerate(story_scenes):
+                    if i not in submitted:
+                        submit_image(i, scene, image_prompts[i], character_description)
+
+                for future in as_completed(list(futures)):
+                    i = futures[future]
+                    image_result = future.result()
+                    if image_result:
+                        image_data, image_url = image_result
+                        image_data_list[i] = image_data
+                        image_url_list[i] = image_url
+                        if image_url:
+                            self.scene_image_callback(i, image_data, image_url)
+
+            logging.debug("=== STORY AND IMAGE GENERATION COMPLETE ===")
             self.status_callback("Story and images generated successfully!")
 
             return story_scenes, image_data_list, image_url_list
@@ -721,8 +1307,17 @@ class UI:
         # Initialize pygame
         pygame.init()
         pygame.font.init()
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # Let SDL composite on the GPU and sync flips to the display refresh; fall back to a plain
+        # software window where no renderer with vsync is available
+        try:
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT),
+                                                  pygame.SCALED | pygame.DOUBLEBUF, vsync=1)
+        except pygame.error as e:
+            logging.debug("Accelerated display unavailable (%s), using a software window", e)
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Picture Story Generator")
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(HANDLED_EVENTS)
 
         # Set window icon if available
         try:
@@ -740,6 +1335,10 @@ class UI:
         # Initial number of scenes
         self.num_scenes = num_scenes
 
+        # Characters typed into each text input; input_text, character_desc, setting_desc and the save
+        # dialog's file_input join them
+        self._buffers: Dict[str, List[str]] = {"prompt": [], "character": [], "setting": [], "file": []}
+
         # Story data
         self.story_prompt = ""
         self.genre = "Fantasy"
@@ -752,18 +1351,36 @@ class UI:
         self.image_url_list = []  # Store the image URLs
         self.current_page = 0
 
+        # Story page layout and the wrapped text surfaces for each page, built on first view and keyed
+        # by (page, text area width) so a layout change re-wraps instead of reusing stale lines
+        self.text_area_width = SCREEN_WIDTH - 100
+        self.text_area_top = SCREEN_HEIGHT//2 + 70
+        self._wrapped_cache: Dict[Tuple[int, int], List[pygame.Surface]] = {}
+        # Advance width of each character measured so far, per font
+        self._advances: Dict[int, Dict[str, int]] = {}
+        # Scaled, display-format copy of each page's image and the original it was made from; the
+        # originals are kept at full size for saving
+        self._display_images: Dict[int, Tuple[pygame.Surface, pygame.Surface]] = {}
+        # Pages whose image is being downloaded on demand
+        self._page_fetches = set()
+        # Decodes scene images as they arrive; results are posted back as IMAGE_READY_EVENT
+        self._decode_pool = ThreadPoolExecutor(max_workers=IMAGE_DECODE_WORKERS)
+
         # State tracking
         self.state = "start_menu"  # States: start_menu, input, generating, viewing
         self.input_text = ""
         self.status_message = ""
         self.image_loading = []
 
-        # Input boxes
-        self.input_box = pygame.Rect((SCREEN_WIDTH - 800)//2, 200, 800, 60)
-        self.character_box = pygame.Rect((SCREEN_WIDTH - 800)//2, 300, 800, 60)
-        self.setting_box = pygame.Rect((SCREEN_WIDTH - 800)//2, 400, 800, 60)
-        self.scenes_input_box = pygame.Rect((SCREEN_WIDTH - 200)//2, 470, 200, 40)
         self.active_input = "prompt"  # Which input is active: "prompt", "character", "setting", "scenes"
+        # Rendered text of each input box with the text it shows, reused until the text changes
+        self._input_surfaces: Dict[str, Tuple[str, pygame.Surface]] = {}
+        # Keys with the same meaning in every input box; any other key types into the active box
+        self._input_key_handlers = {
+            pygame.K_RETURN: self._submit_input,
+            pygame.K_BACKSPACE: self._erase_input,
+            pygame.K_TAB: self._focus_next_input
+        }
 
         # Genre buttons (placeholder - would need to be implemented for full UI)
         self.genre_buttons = {
@@ -776,22 +1393,38 @@ class UI:
         }
         self.selected_genre = "Fantasy"
 
-        # Generate button
-        self.generate_button = pygame.Rect(SCREEN_WIDTH//2 - 150, 520, 300, 60)
-
         # For threading
         self.thread = None
         self.lock = threading.Lock()
 
+        # Set whenever something visible changes; the main loop only redraws when it is set.
+        # Changes confined to part of the screen add its rect to _dirty_rects instead, so only that
+        # area is sent to the display
+        self._dirty = True
+        self._dirty_rects: List[pygame.Rect] = []
+        # Nothing is drawn while the window is minimized
+        self._minimized = False
+        # A status message is waiting to be painted, and when the last one was
+        self._status_pending = False
+        self._last_status_paint = 0
+        # The last status message rendered and its surface
+        self._status_render: Tuple[Optional[str], Optional[pygame.Surface]] = (None, None)
+
         # Create the AI generation manager
         self.ai_generator = AI_Generation(default_num_scenes=num_scenes)
 
         # Set up callbacks
         self.ai_generator.set_callbacks(
             status_callback=self.update_status,
-            image_status_callback=self.update_image_status
+            image_status_callback=self.update_image_status,
+            scenes_callback=self.on_scenes_ready,
+            scene_image_callback=self.on_scene_image_ready
         )
 
+        # Warm up the AI backend in the background while the user is still on the menus
+        if WARM_UP_ON_START:
+            threading.Thread(target=self.ai_generator.warm_up, daemon=True).start()
+
         # Add story storage
         self.story_storage = StoryStorage()
 
@@ -802,26 +1435,293 @@ class UI:
         self.file_list = []
         self.selected_file_index = -1
 
-        # Start menu buttons
-        self.new_story_button = pygame.Rect(SCREEN_WIDTH//2 - 200, 350, 400, 80)
-        self.load_story_button = pygame.Rect(SCREEN_WIDTH//2 - 200, 450, 400, 80)
+        # Image loading indicator squares for the generating screen, keyed by loading state
+        self._indicator_surfaces: Dict[bool, pygame.Surface] = {}
+        for loading, color in ((True, BLUE), (False, GRAY)):
+            self._indicator_surfaces[loading] = pygame.Surface((60, 60))
+            self._indicator_surfaces[loading].fill(color)
+
+        # Dialog surfaces, reused on every frame the dialog is shown
+        self._dim_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA).convert_alpha()
+        self._dim_overlay.fill((0, 0, 0, 128))
+        self._dialog_backgrounds: Dict[str, pygame.Surface] = {}
+
+        # Button and box geometry, shared by the draw methods and the event handlers
+        self._layout()
+
+        # What draws each state's screen and handles its events; the generating screen takes no input
+        self._draw_handlers = {
+            "start_menu": self.draw_start_menu,
+            "input": self.draw_input_screen,
+            "generating": self.draw_generating_screen,
+            "viewing": self.draw_story_page
+        }
+        self._event_handlers = {
+            "start_menu": self.handle_start_menu_events,
+            "input": self.handle_input_events,
+            "viewing": self.handle_viewing_events
+        }
+
+    def _layout(self):
+        """Compute the rects of every button and box; the window size is fixed, so this runs once"""
+        w, h = SCREEN_WIDTH, SCREEN_HEIGHT
+        box_x = (w - 800)//2
+        rects = {
+            # Start menu
+            "new_story_menu": pygame.Rect(w//2 - 200, 350, 400, 80),
+            "load_story_menu": pygame.Rect(w//2 - 200, 450, 400, 80),
+
+            # Input screen; the text inputs are keyed by their active_input name
+            "prompt": pygame.Rect(box_x, 150, 800, 50),
+            "character": pygame.Rect(box_x, 220, 800, 50),
+            "setting": pygame.Rect(box_x, 290, 800, 50),
+            "scenes": pygame.Rect(box_x + 130, 450, 100, 40),
+            "generate": pygame.Rect(w//2 - 150, 540, 300, 50),
+            "back": pygame.Rect(50, 50, 100, 40),
+
+            # Story page
+            "image": pygame.Rect(0, 0, IMG_DIM["width"] - 50, IMG_DIM["height"] - 50),
+            "save": pygame.Rect(80, h - 110, 130, 40),
+            "load": pygame.Rect(w - 210, h - 110, 130, 40),
+            "prev": pygame.Rect(80, h - 60, 130, 40),
+            "next": pygame.Rect(w - 210, h - 60, 130, 40),
+            "new_story": pygame.Rect(w//2 - 100, h - 60, 200, 40),
+            "main_menu": pygame.Rect(w//2 - 100, h - 160, 200, 40),
+
+            # File dialog
+            "dialog": pygame.Rect((w - 600)//2, (h - 500)//2, 600, 500)
+        }
+        rects["image"].center = (w//2, h//3 - 30)
+
+        dialog = rects["dialog"]
+        list_label_height = self.text_font.size("Saved Stories:")[1]
+        rects.update({
+            "dialog_input": pygame.Rect(dialog.x + 30, dialog.y + 110, dialog.width - 60, 40),
+            # The file list sits lower in the save dialog, below the filename input
+            "save_list": pygame.Rect(dialog.x + 30, dialog.y + 170 + list_label_height + 10, dialog.width - 60, 250),
+            "load_list": pygame.Rect(dialog.x + 30, dialog.y + 80 + list_label_height + 10, dialog.width - 60, 250),
+            "cancel": pygame.Rect(dialog.x + 30, dialog.bottom - 60, 150, 40),
+            "action": pygame.Rect(dialog.right - 180, dialog.bottom - 60, 150, 40),
+            "delete": pygame.Rect(dialog.centerx - 75, dialog.bottom - 60, 150, 40)
+        })
+        self._rects: Dict[str, pygame.Rect] = rects
+
+        # Clickable buttons of the story page and the file dialog with what each one does, checked
+        # in order on every click
+        self._viewing_buttons = [
+            (rects["prev"], self._previous_page),
+            (rects["next"], self._next_page),
+            (rects["new_story"], self._new_story),
+            (rects["main_menu"], self._return_to_main_menu),
+            (rects["save"], self.show_save_dialog),
+            (rects["load"], self.show_load_dialog)
+        ]
+        # Smallest rect around all story page buttons; clicks outside it (on the image or text) skip the
+        # per-button tests
+        self._viewing_bbox = self._viewing_buttons[0][0].unionall([rect for rect, _ in self._viewing_buttons[1:]])
+        self._dialog_buttons = [
+            (rects["cancel"], self._close_file_dialog),
+            (rects["action"], self._confirm_file_dialog),
+            (rects["delete"], self._delete_from_file_dialog)
+        ]
+
+    # ----- Text Input Buffers -----
+
+    @property
+    def input_text(self):
+        return "".join(self._buffers["prompt"])
+
+    @input_text.setter
+    def input_text(self, value):
+        self._buffers["prompt"] = list(value)
+
+    @property
+    def character_desc(self):
+        return "".join(self._buffers["character"])
+
+    @character_desc.setter
+    def character_desc(self, value):
+        self._buffers["character"] = list(value)
+
+    @property
+    def setting_desc(self):
+        return "".join(self._buffers["setting"])
+
+    @setting_desc.setter
+    def setting_desc(self, value):
+        self._buffers["setting"] = list(value)
+
+    @property
+    def file_input(self):
+        return "".join(self._buffers["file"])
+
+    @file_input.setter
+    def file_input(self, value):
+        self._buffers["file"] = list(value)
 
     # ----- Callback Methods -----
 
     def update_status(self, message):
         """Callback method to update the status message from AI generation"""
+        if not self._is_active_generation():
+            return
         with self.lock:
             self.status_message = message
-            logging.debug(f"Status update: {message}")
+            # Painted by the main loop, at most once per STATUS_REPAINT_INTERVAL_MS
+            self._status_pending = True
+            logging.debug("Status update: %s", message)
 
     def update_image_status(self, index, is_loading):
-        """Callback method to update image loading status"""
+        """Callback method to update image loading status, unless its generation was abandoned"""
+        if self._is_active_generation():
+            self._set_image_loading(index, is_loading)
+
+    def _set_image_loading(self, index, is_loading):
+        """Mark a page's image as loading or done"""
+        # image_loading is sized when generation starts, so this is normally a single list store,
+        # which needs no lock; it only grows for pages fetched on demand outside a generation.
+        # The list can be replaced by a new story meanwhile, so the index is checked against the one stored to
+        image_loading = self.image_loading
+        if index >= len(image_loading):
+            with self.lock:
+                image_loading.extend([False] * (index + 1 - len(image_loading)))
+        image_loading[index] = bool(is_loading)
+        self._dirty = True
+        logging.debug("Image %s loading status: %s", index+1, is_loading)
+
+    def on_scenes_ready(self, scenes):
+        """Callback method receiving the scene texts before their images are generated"""
+        if not self._is_active_generation():
+            return
+        with self.lock:
+            self.story_scenes = list(scenes)
+            self.generated_images = [None] * len(scenes)
+            self.image_url_list = [None] * len(scenes)
+            self._clear_page_cache()
+            self._dirty = True
+
+    def on_scene_image_ready(self, index, image_data, image_url):
+        """
+        Callback method receiving each scene image as soon as it has been downloaded, or only its URL
+        when images are fetched on demand. The image is decoded on the decode pool and handed to the
+        main loop, so the generation thread can go straight back to collecting results
+        """
+        if not self._is_active_generation():
+            return
+        generation = threading.current_thread()
+        if image_data:
+            self._decode_pool.submit(self._decode_scene_image, generation, index, image_data, image_url)
+        else:
+            self._post_scene_image(generation, index, None, image_url)
+
+    def _decode_scene_image(self, generation, index, image_data, image_url):
+        """
+        Decode a downloaded scene image on the decode pool, scale a copy to the story page's image size
+        and post both to the main loop
+        """
+        try:
+            image = pygame.image.load(io.BytesIO(image_data))
+        except Exception as e:
+            logging.error(f"Error converting image: {str(e)}")
+            return
+        try:
+            scaled = self._scale_for_display(image)
+        except (pygame.error, ValueError):
+            scaled = None  # e.g. a palette image smoothscale can't take; the page scales it when drawn
+        self._post_scene_image(generation, index, image, image_url, scaled)
+
+    def _scale_for_display(self, image):
+        """Return a copy of a scene image at the story page's image size (the image itself if it already is)"""
+        size = self._rects["image"].size
+        if image.get_size() == size:
+            return image
+        return pygame.transform.smoothscale(image, size)
+
+    def _post_scene_image(self, generation, index, image, image_url, scaled=None):
+        """Hand a scene image (or only its URL) to the main loop; pygame allows posting from any thread"""
+        pygame.event.post(pygame.event.Event(
+            IMAGE_READY_EVENT, generation=generation, index=index, image=image, image_url=image_url,
+            scaled=scaled
+        ))
+
+    def handle_image_ready(self, event):
+        """Store a decoded scene image posted by the decode pool, unless its generation was abandoned"""
+        if event.generation is not self.thread:
+            return
         with self.lock:
-            # Make sure the image_loading list is long enough
-            while len(self.image_loading) <= index:
-                self.image_loading.append(False)
-            self.image_loading[index] = is_loading
-            logging.debug(f"Image {index+1} loading status: {is_loading}")
+            if event.index >= len(self.generated_images):
+                return
+            self.generated_images[event.index] = event.image
+            self.image_url_list[event.index] = event.image_url
+            # Converting to the display format has to happen here, on the thread that owns the display
+            if event.scaled is not None:
+                self._display_images[event.index] = (event.image, event.scaled.convert())
+
+            # Show the story as soon as its first page is illustrated; the rest fill in as they arrive
+            if event.index == 0 and self.state == "generating":
+                self.state = "viewing"
+                self.current_page = 0
+
+    def _fetch_page_image(self, page):
+        """Download the image of a page in the background if only its URL is known"""
+        if page in self._page_fetches or not (0 <= page < len(self.image_url_list)):
+            return
+        image_url = self.image_url_list[page]
+        if not image_url or (page < len(self.generated_images) and self.generated_images[page] is not None):
+            return
+
+        self._page_fetches.add(page)
+        self._set_image_loading(page, True)
+
+        def fetch():
+            try:
+                image = pygame.image.load(io.BytesIO(self.ai_generator.fetch_image_bytes(image_url)))
+                with self.lock:
+                    if page < len(self.generated_images) and self.image_url_list[page] == image_url:
+                        self.generated_images[page] = image
+            except Exception as e:
+                logging.error(f"Error loading image from URL: {str(e)}")
+            finally:
+                self._page_fetches.discard(page)
+                self._set_image_loading(page, False)
+
+        threading.Thread(target=fetch, daemon=True).start()
+
+    def _typing_area(self, event):
+        """
+        Return the screen strip a key press edits if it only types into the active input box,
+        otherwise None
+        """
+        if event.type != pygame.KEYDOWN or self.state != "input" or self.show_file_dialog:
+            return None
+        # The scene count is also shown in the instructions, so editing it redraws the whole screen
+        if event.key in (pygame.K_RETURN, pygame.K_TAB) or self.active_input == "scenes":
+            return None
+        box = self._rects[self.active_input]
+        # Text can run past the box, so the whole row is refreshed
+        return pygame.Rect(0, box.top, SCREEN_WIDTH, box.height)
+
+    def _status_surface(self):
+        """
+        Return the rendered status message. Only the latest one is kept: messages rarely repeat, but
+        the same one is often redrawn, e.g. while image indicators change underneath it
+        """
+        message = self.status_message
+        if self._status_render[0] != message:
+            self._status_render = (message, self.text_font.render(message, True, BLACK))
+        return self._status_render[1]
+
+    def _clear_page_cache(self):
+        """Drop cached per-page surfaces; call whenever story_scenes is replaced"""
+        self._wrapped_cache.clear()
+        self._display_images.clear()
+
+    def _is_active_generation(self):
+        """
+        True when called from the generation thread whose results the UI is still waiting for, or from one
+        of its image workers
+        """
+        return self.ai_generator.current_generation() is self.thread
 
     # ----- Drawing Methods -----
 
@@ -830,37 +1730,38 @@ class UI:
         self.screen.fill(WHITE)
 
         # Title
-        title_surface = self.title_font.render("Picture Story Generator", True, TITLE_BLUE)
+        title_surface = _cached_render(self.title_font, "Picture Story Generator", TITLE_BLUE)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH//2, 150))
         self.screen.blit(title_surface, title_rect)
 
         # Subtitle
-        subtitle_surface = self.text_font.render("Create illustrated stories with AI", True, BLACK)
+        subtitle_surface = _cached_render(self.text_font, "Create illustrated stories with AI", BLACK)
         subtitle_rect = subtitle_surface.get_rect(center=(SCREEN_WIDTH//2, 200))
         self.screen.blit(subtitle_surface, subtitle_rect)
 
         # New Story button
-        pygame.draw.rect(self.screen, BLUE, self.new_story_button)
-        new_story_text = self.title_font.render("Create New Story", True, WHITE)
-        new_story_rect = new_story_text.get_rect(center=self.new_story_button.center)
+        pygame.draw.rect(self.screen, BLUE, self._rects["new_story_menu"])
+        new_story_text = _cached_render(self.title_font, "Create New Story", WHITE)
+        new_story_rect = new_story_text.get_rect(center=self._rects["new_story_menu"].center)
         self.screen.blit(new_story_text, new_story_rect)
 
         # Load Story button
-        pygame.draw.rect(self.screen, BLUE, self.load_story_button)
-        load_story_text = self.title_font.render("Load Existing Story", True, WHITE)
-        load_story_rect = load_story_text.get_rect(center=self.load_story_button.center)
+        pygame.draw.rect(self.screen, BLUE, self._rects["load_story_menu"])
+        load_story_text = _cached_render(self.title_font, "Load Existing Story", WHITE)
+        load_story_rect = load_story_text.get_rect(center=self._rects["load_story_menu"].center)
         self.screen.blit(load_story_text, load_story_rect)
 
         # Version info
-        version_text = self.text_font.render("v1.0", True, DARK_GRAY)
+        version_text = _cached_render(self.text_font, "v1.0", DARK_GRAY)
         version_rect = version_text.get_rect(bottomright=(SCREEN_WIDTH - 20, SCREEN_HEIGHT - 20))
         self.screen.blit(version_text, version_rect)
 
         # Check if there are any saved stories
         num_stories = len(self.story_storage.list_saved_stories())
         if num_stories > 0:
+            # The count changes as stories are saved, so it is rendered directly rather than cached
             saved_stories_text = self.text_font.render(f"{num_stories} saved stories available", True, DARK_GRAY)
-            saved_stories_rect = saved_stories_text.get_rect(center=(SCREEN_WIDTH//2, self.load_story_button.bottom + 30))
+            saved_stories_rect = saved_stories_text.get_rect(center=(SCREEN_WIDTH//2, self._rects["load_story_menu"].bottom + 30))
             self.screen.blit(saved_stories_text, saved_stories_rect)
 
     def draw_input_screen(self):
@@ -868,141 +1769,115 @@ class UI:
         self.screen.fill(WHITE)
 
         # Title - moved up
-        title_surface = self.title_font.render("Picture Story Generator", True, BLACK)
+        title_surface = _cached_render(self.title_font, "Picture Story Generator", BLACK)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH//2, 60))
         self.screen.blit(title_surface, title_rect)
 
         # Instructions - more compact
         instructions = [
             "Enter your story idea below",
-            f"The app will generate a {self.num_scenes}-scene story with images."
+            f"The app will generate a {self.num_scenes or 3}-scene story with images."
         ]
 
         for i, instruction in enumerate(instructions):
-            text_surface = self.text_font.render(instruction, True, BLACK)
+            text_surface = _cached_render(self.text_font, instruction, BLACK)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH//2, 100 + i*25))
             self.screen.blit(text_surface, text_rect)
 
-        # Vertical starting position - moved up
-        start_y = 150
-        spacing = 70  # Reduced spacing between elements
-
-        # Prompt input - repositioned
-        prompt_y = start_y
-        prompt_label = self.text_font.render("Story Idea:", True, BLACK)
-        self.input_box = pygame.Rect((SCREEN_WIDTH - 800)//2, prompt_y, 800, 50)
-        prompt_label_rect = prompt_label.get_rect(midright=(self.input_box.x - 10, self.input_box.y + self.input_box.height//2))
-        self.screen.blit(prompt_label, prompt_label_rect)
-
-        pygame.draw.rect(self.screen, GRAY if self.active_input == "prompt" else DARK_GRAY, self.input_box, 2)
-        text_surface = self.input_font.render(self.input_text, True, BLACK)
-        text_rect = text_surface.get_rect(midleft=(self.input_box.x + 10, self.input_box.y + self.input_box.height//2))
-        self.screen.blit(text_surface, text_rect)
-
-        # Character input - repositioned
-        char_y = prompt_y + spacing
-        char_label = self.text_font.render("Character (Optional):", True, BLACK)
-        self.character_box = pygame.Rect((SCREEN_WIDTH - 800)//2, char_y, 800, 50)
-        char_label_rect = char_label.get_rect(midright=(self.character_box.x - 10, self.character_box.y + self.character_box.height//2))
-        self.screen.blit(char_label, char_label_rect)
-
-        pygame.draw.rect(self.screen, GRAY if self.active_input == "character" else DARK_GRAY, self.character_box, 2)
-        char_surface = self.input_font.render(self.character_desc, True, BLACK)
-        char_rect = char_surface.get_rect(midleft=(self.character_box.x + 10, self.character_box.y + self.character_box.height//2))
-        self.screen.blit(char_surface, char_rect)
-
-        # Setting input - repositioned (moved before genre/tone/style)
-        setting_y = char_y + spacing
-        setting_label = self.text_font.render("Setting (Optional):", True, BLACK)
-        self.setting_box = pygame.Rect((SCREEN_WIDTH - 800)//2, setting_y, 800, 50)
-        setting_label_rect = setting_label.get_rect(midright=(self.setting_box.x - 10, self.setting_box.y + self.setting_box.height//2))
-        self.screen.blit(setting_label, setting_label_rect)
-
-        pygame.draw.rect(self.screen, GRAY if self.active_input == "setting" else DARK_GRAY, self.setting_box, 2)
-        setting_surface = self.input_font.render(self.setting_desc, True, BLACK)
-        setting_rect = setting_surface.get_rect(midleft=(self.setting_box.x + 10, self.setting_box.y + self.setting_box.height//2))
-        self.screen.blit(setting_surface, setting_rect)
+        # Input boxes with their labels and values
+        for name in INPUT_LABELS:
+            self._draw_input_row(name)
 
         # Genre, Tone, Art Style - moved after Setting and better aligned
-        info_y = setting_y + spacing
-        info_x = (SCREEN_WIDTH - 800)//2  # Left-aligned with the input boxes
-        label_width = 120  # Fixed width for labels
-        value_x = info_x + label_width + 10  # Position for the values
+        info_y = self._rects["setting"].bottom + 20
+        info_x = self._rects["setting"].x  # Left-aligned with the input boxes
+        value_x = self._rects["scenes"].x  # Values line up with the scenes box
 
         # Genre selection - left-aligned with input boxes
-        genre_label = self.text_font.render("Selected Genre:", True, BLACK)
+        genre_label = _cached_render(self.text_font, "Selected Genre:", BLACK)
         genre_label_rect = genre_label.get_rect(left=info_x, centery=info_y)
         self.screen.blit(genre_label, genre_label_rect)
 
-        genre_value = self.text_font.render(self.genre, True, BLUE)
+        genre_value = _cached_render(self.text_font, self.genre, BLUE)
         genre_value_rect = genre_value.get_rect(left=value_x, centery=info_y)
         self.screen.blit(genre_value, genre_value_rect)
 
         # Tone selection - left-aligned with input boxes
         tone_y = info_y + 30
-        tone_label = self.text_font.render("Story Tone:", True, BLACK)
+        tone_label = _cached_render(self.text_font, "Story Tone:", BLACK)
         tone_label_rect = tone_label.get_rect(left=info_x, centery=tone_y)
         self.screen.blit(tone_label, tone_label_rect)
 
-        tone_value = self.text_font.render(self.tone, True, BLUE)
+        tone_value = _cached_render(self.text_font, self.tone, BLUE)
         tone_value_rect = tone_value.get_rect(left=value_x, centery=tone_y)
         self.screen.blit(tone_value, tone_value_rect)
 
         # Art style selection - left-aligned with input boxes
         art_y = tone_y + 30
-        art_label = self.text_font.render("Art Style:", True, BLACK)
+        art_label = _cached_render(self.text_font, "Art Style:", BLACK)
         art_label_rect = art_label.get_rect(left=info_x, centery=art_y)
         self.screen.blit(art_label, art_label_rect)
 
-        art_value = self.text_font.render(self.art_style, True, BLUE)
+        art_value = _cached_render(self.text_font, self.art_style, BLUE)
         art_value_rect = art_value.get_rect(left=value_x, centery=art_y)
         self.screen.blit(art_value, art_value_rect)
 
-        # Scenes Input - repositioned
-        scenes_y = art_y + 50
-        scenes_label = self.text_font.render("Number of scenes:", True, BLACK)
-        self.scenes_input_box = pygame.Rect(value_x, scenes_y - 20, 100, 40)
-        scenes_label_rect = scenes_label.get_rect(left=info_x, centery=scenes_y)
-        self.screen.blit(scenes_label, scenes_label_rect)
-
-        pygame.draw.rect(self.screen, GRAY if self.active_input == "scenes" else DARK_GRAY, self.scenes_input_box, 2)
-        scenes_text = self.text_font.render(str(self.num_scenes), True, BLACK)
-        scenes_text_rect = scenes_text.get_rect(center=self.scenes_input_box.center)
-        self.screen.blit(scenes_text, scenes_text_rect)
-
         # Generate button - moved down
-        button_y = scenes_y + 70
-        self.generate_button = pygame.Rect(SCREEN_WIDTH//2 - 150, button_y, 300, 50)
-        pygame.draw.rect(self.screen, BLUE, self.generate_button)
-        button_text = self.text_font.render("Generate Story", True, WHITE)
-        button_rect = button_text.get_rect(center=self.generate_button.center)
+        generate_button = self._rects["generate"]
+        pygame.draw.rect(self.screen, BLUE, generate_button)
+        button_text = _cached_render(self.text_font, "Generate Story", WHITE)
+        button_rect = button_text.get_rect(center=generate_button.center)
         self.screen.blit(button_text, button_rect)
 
         # Back button (to return to start menu)
-        back_button = pygame.Rect(50, 50, 100, 40)
+        back_button = self._rects["back"]
         pygame.draw.rect(self.screen, GRAY, back_button)
-        back_text = self.text_font.render("Back", True, BLACK)
+        back_text = _cached_render(self.text_font, "Back", BLACK)
         back_text_rect = back_text.get_rect(center=back_button.center)
         self.screen.blit(back_text, back_text_rect)
 
         # Status message
         if self.status_message:
-            status_surface = self.text_font.render(self.status_message, True, BLACK)
-            status_rect = status_surface.get_rect(center=(SCREEN_WIDTH//2, button_y + 70))
+            status_surface = self._status_surface()
+            status_rect = status_surface.get_rect(center=(SCREEN_WIDTH//2, generate_button.bottom + 20))
             self.screen.blit(status_surface, status_rect)
 
+    def _draw_input_row(self, name):
+        """Draw one input box of the input screen with its label and current value"""
+        box = self._rects[name]
+        label = _cached_render(self.text_font, INPUT_LABELS[name], BLACK)
+        pygame.draw.rect(self.screen, GRAY if self.active_input == name else DARK_GRAY, box, 2)
+        if name == "scenes":
+            # The scenes label sits left-aligned under the other labels, its value centered in the box
+            self.screen.blit(label, label.get_rect(left=self._rects["setting"].x, centery=box.centery))
+            value = _cached_render(self.text_font, str(self.num_scenes) if self.num_scenes else "", BLACK)
+            self.screen.blit(value, value.get_rect(center=box.center))
+        else:
+            self.screen.blit(label, label.get_rect(midright=(box.x - 10, box.centery)))
+            value = self._input_value_surface(name)
+            self.screen.blit(value, value.get_rect(midleft=(box.x + 10, box.centery)))
+
+    def _input_value_surface(self, name):
+        """Return the rendered text of an input box, rendering it again only after it was edited"""
+        text = "".join(self._buffers[name])
+        cached = self._input_surfaces.get(name)
+        if cached is None or cached[0] != text:
+            cached = (text, self.input_font.render(text, True, BLACK))
+            self._input_surfaces[name] = cached
+        return cached[1]
+
     def draw_generating_screen(self):
         """Draw the loading screen while generating the story"""
         self.screen.fill(WHITE)
 
         # Title
-        title_surface = self.title_font.render("Generating Your Story...", True, BLACK)
+        title_surface = _cached_render(self.title_font, "Generating Your Story...", BLACK)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH//2, 100))
         self.screen.blit(title_surface, title_rect)
 
         # Status message
         if self.status_message:
-            status_surface = self.text_font.render(self.status_message, True, BLACK)
+            status_surface = self._status_surface()
             status_rect = status_surface.get_rect(center=(SCREEN_WIDTH//2, 180))
             self.screen.blit(status_surface, status_rect)
 
@@ -1015,162 +1890,166 @@ class UI:
         total_width = len(self.image_loading) * indicator_spacing
         start_x = (SCREEN_WIDTH - total_width) // 2 + indicator_spacing // 2
 
-        for i in range(len(self.image_loading)):
-            color = BLUE if i < len(self.image_loading) and self.image_loading[i] else GRAY
+        # Each indicator is a pre-filled square for its state plus its cached label, drawn in one call
+        indicators = []
+        for i, loading in enumerate(self.image_loading):
             indicator_x = start_x + i * indicator_spacing
-            indicator_rect = pygame.Rect(indicator_x - indicator_width//2, 300, indicator_width, indicator_height)
-            pygame.draw.rect(self.screen, color, indicator_rect)
-            text = self.text_font.render(f"Image {i+1}", True, BLACK)
-            text_rect = text.get_rect(center=(indicator_x, 380))
-            self.screen.blit(text, text_rect)
+            indicators.append((self._indicator_surfaces[bool(loading)], (indicator_x - indicator_width//2, 300)))
+            text = _cached_render(self.text_font, f"Image {i+1}", BLACK)
+            indicators.append((text, text.get_rect(center=(indicator_x, 380))))
+        self.screen.blits(indicators, False)
 
     def draw_story_page(self):
         """Draw the story viewing screen"""
         self.screen.fill(WHITE)
 
-        if 0 <= self.current_page < len(self.story_scenes):
+        # Read the story lists once; the generation thread may swap in new ones while this frame draws
+        scenes = self.story_scenes
+        images = self.generated_images
+
+        if 0 <= self.current_page < len(scenes):
             # Display image - slightly smaller
-            img_display_width = IMG_DIM["width"] - 50
-            img_display_height = IMG_DIM["height"] - 50
-
-            if self.current_page < len(self.generated_images) and self.generated_images[self.current_page]:
-                image = self.generated_images[self.current_page]
-                # Scale to display size
-                image = pygame.transform.scale(image, (img_display_width, img_display_height))
-                image_rect = image.get_rect()
-                image_rect.center = (SCREEN_WIDTH//2, SCREEN_HEIGHT//3 - 30)  # Moved up
-                self.screen.blit(image, image_rect)
+            image_rect = self._rects["image"]
+
+            if self.current_page < len(images) and images[self.current_page]:
+                image = images[self.current_page]
+                # Scale to display size once per image, converted to the screen's pixel format
+                cached = self._display_images.get(self.current_page)
+                if cached is None or cached[0] is not image:
+                    scaled = self._scale_for_display(image.convert())
+                    cached = (image, scaled)
+                    self._display_images[self.current_page] = cached
+                self.screen.blit(cached[1], image_rect)
             else:
                 # Placeholder for image - smaller and moved up
-                pygame.draw.rect(self.screen, GRAY, (SCREEN_WIDTH//2 - img_display_width//2, 
-                                                   SCREEN_HEIGHT//3 - 30 - img_display_height//2, 
-                                                   img_display_width, img_display_height))
+                pygame.draw.rect(self.screen, GRAY, image_rect)
 
             # Display scene text
-            scene_text = self.story_scenes[self.current_page]
+            scene_text = scenes[self.current_page]
 
             # Display scene number - moved to top
-            scene_label = self.title_font.render(f"Scene {self.current_page + 1}", True, TITLE_BLUE)
+            scene_label = _cached_render(self.title_font, f"Scene {self.current_page + 1}", TITLE_BLUE)
             scene_label_rect = scene_label.get_rect(center=(SCREEN_WIDTH//2, 20))
             self.screen.blit(scene_label, scene_label_rect)
 
-            # Calculate text area - moved up and expanded
-            text_area_width = SCREEN_WIDTH - 100
-            text_area_top = SCREEN_HEIGHT//2 + 70  # Moved up
-
-            # Wrap text
-            wrapped_text = []
-            words = scene_text.split()
-            line = ""
-            for word in words:
-                test_line = line + word + " "
-                text_width = self.text_font.size(test_line)[0]
-                if text_width < text_area_width:
-                    line = test_line
-                else:
-                    wrapped_text.append(line)
-                    line = word + " "
-            wrapped_text.append(line)
+            # Wrap and render the text once per page, then reuse the surfaces on later frames
+            wrap_key = (self.current_page, self.text_area_width)
+            line_surfaces = self._wrapped_cache.get(wrap_key)
+            if line_surfaces is None:
+                wrapped_text = self._wrap_text(scene_text, self.text_font, self.text_area_width)
+                line_surfaces = [self.text_font.render(line, True, BLACK).convert_alpha() for line in wrapped_text]
+                self._wrapped_cache[wrap_key] = line_surfaces
 
             # Render wrapped text - smaller line spacing
-            text_y_start = text_area_top
+            text_y_start = self.text_area_top
             line_spacing = 25  # Reduced from 32
-            for i, line in enumerate(wrapped_text):
-                text_surface = self.text_font.render(line, True, BLACK)
+            for i, text_surface in enumerate(line_surfaces):
                 text_rect = text_surface.get_rect()
                 text_rect.left = 50
                 text_rect.top = text_y_start + i * line_spacing
                 self.screen.blit(text_surface, text_rect)
 
-        # Navigation controls - moved up
-        button_y = SCREEN_HEIGHT - 60
-
-        # Save button
-        save_button = pygame.Rect(80, button_y - 50, 130, 40)
-        pygame.draw.rect(self.screen, BLUE, save_button)
-        save_text = self.text_font.render("Save Story", True, WHITE)
-        save_text_rect = save_text.get_rect(center=save_button.center)
-        self.screen.blit(save_text, save_text_rect)
-
-        # Load button
-        load_button = pygame.Rect(SCREEN_WIDTH - 210, button_y - 50, 130, 40)
-        pygame.draw.rect(self.screen, BLUE, load_button)
-        load_text = self.text_font.render("Load Story", True, WHITE)
-        load_text_rect = load_text.get_rect(center=load_button.center)
-        self.screen.blit(load_text, load_text_rect)
-
-        # Previous button
-        prev_button = pygame.Rect(80, button_y, 130, 40)
-        pygame.draw.rect(self.screen, BLUE if self.current_page > 0 else DARK_GRAY, prev_button)
-        prev_text = self.text_font.render("Previous", True, WHITE)
-        prev_text_rect = prev_text.get_rect(center=prev_button.center)
-        self.screen.blit(prev_text, prev_text_rect)
-
-        # Next button
-        next_button = pygame.Rect(SCREEN_WIDTH - 210, button_y, 130, 40)
-        pygame.draw.rect(self.screen, BLUE if self.current_page < len(self.story_scenes) - 1 else DARK_GRAY, next_button)
-        next_text = self.text_font.render("Next", True, WHITE)
-        next_text_rect = next_text.get_rect(center=next_button.center)
-        self.screen.blit(next_text, next_text_rect)
-
         # Page indicator
-        page_text = self.text_font.render(f"Page {self.current_page + 1} of {len(self.story_scenes)}", True, BLACK)
-        page_text_rect = page_text.get_rect(center=(SCREEN_WIDTH//2, button_y - 25))
-        self.screen.blit(page_text, page_text_rect)
-
-        # New story button
-        new_story_button = pygame.Rect(SCREEN_WIDTH//2 - 100, button_y, 200, 40)
-        pygame.draw.rect(self.screen, GRAY, new_story_button)
-        new_story_text = self.text_font.render("New Story", True, BLACK)
-        new_story_text_rect = new_story_text.get_rect(center=new_story_button.center)
-        self.screen.blit(new_story_text, new_story_text_rect)
-
-        # Back to main menu button
-        main_menu_button = pygame.Rect(SCREEN_WIDTH//2 - 100, button_y - 100, 200, 40)
-        pygame.draw.rect(self.screen, GRAY, main_menu_button)
-        main_menu_text = self.text_font.render("Main Menu", True, BLACK)
-        main_menu_text_rect = main_menu_text.get_rect(center=main_menu_button.center)
-        self.screen.blit(main_menu_text, main_menu_text_rect)
+        rects = self._rects
+        page_text = self.text_font.render(f"Page {self.current_page + 1} of {len(scenes)}", True, BLACK)
+        page_text_rect = page_text.get_rect(center=(SCREEN_WIDTH//2, rects["prev"].top - 25))
+
+        # Buttons are pre-composed surfaces, drawn together with the page indicator in one call
+        has_prev = self.current_page > 0
+        has_next = self.current_page < len(scenes) - 1
+        self.screen.blits([
+            # Save button
+            (_cached_button(self.text_font, rects["save"].size, BLUE, "Save Story", WHITE), rects["save"]),
+            # Load button
+            (_cached_button(self.text_font, rects["load"].size, BLUE, "Load Story", WHITE), rects["load"]),
+            # Previous button
+            (_cached_button(self.text_font, rects["prev"].size, BLUE if has_prev else DARK_GRAY, "Previous", WHITE), rects["prev"]),
+            # Next button
+            (_cached_button(self.text_font, rects["next"].size, BLUE if has_next else DARK_GRAY, "Next", WHITE), rects["next"]),
+            (page_text, page_text_rect),
+            # New story button
+            (_cached_button(self.text_font, rects["new_story"].size, GRAY, "New Story", BLACK), rects["new_story"]),
+            # Back to main menu button
+            (_cached_button(self.text_font, rects["main_menu"].size, GRAY, "Main Menu", BLACK), rects["main_menu"])
+        ], False)
+
+    def _text_width(self, font, text):
+        """
+        Width of text in font, summed from per-character advance widths. Each character is measured
+        with the font once and then served from the advance table
+        """
+        advances = self._advances.setdefault(id(font), {})
+        width = 0
+        for char in text:
+            advance = advances.get(char)
+            if advance is None:
+                metrics = font.metrics(char)[0]
+                advance = metrics[4] if metrics else font.size(char)[0]
+                advances[char] = advance
+            width += advance
+        return width
+
+    def _wrap_text(self, text, font, max_width):
+        """
+        Break text into lines narrower than max_width. Each word is measured once and line widths
+        are accumulated, instead of re-measuring the whole line every time a word is added
+        """
+        words = text.split()
+        widths = [self._text_width(font, word + " ") for word in words]
+
+        lines = []
+        line = []
+        line_width = 0
+        for word, width in zip(words, widths):
+            if line and line_width + width >= max_width:
+                lines.append(" ".join(line) + " ")
+                line = []
+                line_width = 0
+            line.append(word)
+            line_width += width
+        lines.append(" ".join(line) + " " if line else "")
+        return lines
 
     def draw_file_dialog(self):
         """Draw a dialog for saving/loading files"""
         # Darken the background
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._dim_overlay, (0, 0))
 
         # Dialog box
-        dialog_width = 600
-        dialog_height = 500
-        dialog_x = (SCREEN_WIDTH - dialog_width) // 2
-        dialog_y = (SCREEN_HEIGHT - dialog_height) // 2
-        dialog_rect = pygame.Rect(dialog_x, dialog_y, dialog_width, dialog_height)
-        pygame.draw.rect(self.screen, WHITE, dialog_rect)
-        pygame.draw.rect(self.screen, BLACK, dialog_rect, 2)
-
-        # Title
-        title_text = "Save Story" if self.file_dialog_mode == "save" else "Load Story"
-        title_surface = self.title_font.render(title_text, True, BLACK)
-        title_rect = title_surface.get_rect(centerx=dialog_x + dialog_width//2, top=dialog_y + 20)
-        self.screen.blit(title_surface, title_rect)
+        rects = self._rects
+        dialog = rects["dialog"]
+
+        # Box, border and title are composed once per dialog mode
+        dialog_bg = self._dialog_backgrounds.get(self.file_dialog_mode)
+        if dialog_bg is None:
+            dialog_bg = pygame.Surface(dialog.size)
+            dialog_bg.fill(WHITE)
+            pygame.draw.rect(dialog_bg, BLACK, dialog_bg.get_rect(), 2)
+
+            # Title
+            title_text = "Save Story" if self.file_dialog_mode == "save" else "Load Story"
+            title_surface = _cached_render(self.title_font, title_text, BLACK)
+            dialog_bg.blit(title_surface, title_surface.get_rect(centerx=dialog.width//2, top=20))
+            self._dialog_backgrounds[self.file_dialog_mode] = dialog_bg
+        self.screen.blit(dialog_bg, dialog)
 
         if self.file_dialog_mode == "save":
             # Input field for filename
-            input_label = self.text_font.render("Enter filename:", True, BLACK)
-            input_label_rect = input_label.get_rect(left=dialog_x + 30, top=dialog_y + 80)
+            input_label = _cached_render(self.text_font, "Enter filename:", BLACK)
+            input_label_rect = input_label.get_rect(left=dialog.x + 30, top=dialog.y + 80)
             self.screen.blit(input_label, input_label_rect)
 
-            input_box = pygame.Rect(dialog_x + 30, dialog_y + 110, dialog_width - 60, 40)
+            input_box = rects["dialog_input"]
             pygame.draw.rect(self.screen, GRAY, input_box, 2)
             input_text = self.input_font.render(self.file_input, True, BLACK)
             self.screen.blit(input_text, (input_box.x + 10, input_box.y + 10))
 
         # File list (for both save and load)
-        list_label = self.text_font.render("Saved Stories:", True, BLACK)
-        list_label_rect = list_label.get_rect(left=dialog_x + 30, top=dialog_y + (170 if self.file_dialog_mode == "save" else 80))
+        list_label = _cached_render(self.text_font, "Saved Stories:", BLACK)
+        list_box = rects["save_list" if self.file_dialog_mode == "save" else "load_list"]
+        list_label_rect = list_label.get_rect(left=list_box.left, bottom=list_box.top - 10)
         self.screen.blit(list_label, list_label_rect)
 
-        list_box = pygame.Rect(dialog_x + 30, list_label_rect.bottom + 10, dialog_width - 60, 250)
         pygame.draw.rect(self.screen, GRAY, list_box, 1)
 
         # Draw file items
@@ -1191,39 +2070,30 @@ class UI:
             scenes = file_info.get("num_scenes", 0)
             file_text = f"{title} - {date} ({scenes} scenes)"
 
+            # Saved file names are unbounded, so they are not kept in the render cache
             text_surface = self.text_font.render(file_text, True, BLACK)
             self.screen.blit(text_surface, (item_rect.left + 10, item_rect.top + 5))
 
-        # Action buttons
-        button_y = dialog_y + dialog_height - 60
-
-        # Cancel button
-        cancel_button = pygame.Rect(dialog_x + 30, button_y, 150, 40)
-        pygame.draw.rect(self.screen, GRAY, cancel_button)
-        cancel_text = self.text_font.render("Cancel", True, BLACK)
-        cancel_text_rect = cancel_text.get_rect(center=cancel_button.center)
-        self.screen.blit(cancel_text, cancel_text_rect)
-
         # Save/Load button
-        action_button = pygame.Rect(dialog_x + dialog_width - 180, button_y, 150, 40)
         action_text = "Save" if self.file_dialog_mode == "save" else "Load"
 
         # Determine if button should be active
         button_active = (self.file_dialog_mode == "save" and self.file_input.strip()) or \
                         (self.file_dialog_mode == "load" and self.selected_file_index >= 0)
 
-        pygame.draw.rect(self.screen, BLUE if button_active else DARK_GRAY, action_button)
-        action_text_surface = self.text_font.render(action_text, True, WHITE)
-        action_text_rect = action_text_surface.get_rect(center=action_button.center)
-        self.screen.blit(action_text_surface, action_text_rect)
+        buttons = [
+            # Cancel button
+            (_cached_button(self.text_font, rects["cancel"].size, GRAY, "Cancel", BLACK), rects["cancel"]),
+            (_cached_button(self.text_font, rects["action"].size, BLUE if button_active else DARK_GRAY, action_text, WHITE),
+             rects["action"])
+        ]
 
         # Delete button (only for load dialog)
         if self.file_dialog_mode == "load" and self.selected_file_index >= 0:
-            delete_button = pygame.Rect(dialog_x + dialog_width//2 - 75, button_y, 150, 40)
-            pygame.draw.rect(self.screen, (200, 0, 0), delete_button)
-            delete_text = self.text_font.render("Delete", True, WHITE)
-            delete_text_rect = delete_text.get_rect(center=delete_button.center)
-            self.screen.blit(delete_text, delete_text_rect)
+            buttons.append((_cached_button(self.text_font, rects["delete"].size, (200, 0, 0), "Delete", WHITE),
+                            rects["delete"]))
+
+        self.screen.blits(buttons, False)
 
     # ----- Event Handling Methods -----
 
@@ -1231,8 +2101,9 @@ class UI:
         """Handle events for the start menu screen"""
         if event.type == pygame.MOUSEBUTTONDOWN:
             # Check if the "Create New Story" button is clicked
-            if self.new_story_button.collidepoint(event.pos):
+            if self._rects["new_story_menu"].collidepoint(event.pos):
                 self.state = "input"
+                self.active_input = "prompt"  # May still be "file" from a dialog
                 self.input_text = ""
                 self.character_desc = ""
                 self.setting_desc = ""
@@ -1240,7 +2111,7 @@ class UI:
                 logging.debug("Starting new story from main menu")
 
             # Check if the "Load Existing Story" button is clicked
-            elif self.load_story_button.collidepoint(event.pos):
+            elif self._rects["load_story_menu"].collidepoint(event.pos):
                 self.show_load_dialog()
                 logging.debug("Opening load dialog from main menu")
 
@@ -1248,162 +2119,122 @@ class UI:
         """Handle events for the input screen"""
         if event.type == pygame.MOUSEBUTTONDOWN:
             # Check if back button was clicked
-            back_button = pygame.Rect(50, 50, 100, 40)
-            if back_button.collidepoint(event.pos):
+            rects = self._rects
+            if rects["back"].collidepoint(event.pos):
                 self.state = "start_menu"
                 return
 
             # Check if the prompt input box is clicked
-            if self.input_box.collidepoint(event.pos):
+            if rects["prompt"].collidepoint(event.pos):
                 self.active_input = "prompt"
 
             # Check if the character input box is clicked
-            elif self.character_box.collidepoint(event.pos):
+            elif rects["character"].collidepoint(event.pos):
                 self.active_input = "character"
 
             # Check if the setting input box is clicked
-            elif self.setting_box.collidepoint(event.pos):
+            elif rects["setting"].collidepoint(event.pos):
                 self.active_input = "setting"
 
             # Check if the scenes input box is clicked
-            elif self.scenes_input_box.collidepoint(event.pos):
+            elif rects["scenes"].collidepoint(event.pos):
                 self.active_input = "scenes"
 
             # Check if generate button is clicked
-            elif self.generate_button.collidepoint(event.pos) and self.input_text.strip():
-                try:
-                    # Make sure num_scenes is a valid number
-                    num = int(self.num_scenes)
-                    if num < 1:
-                        self.num_scenes = 1
-                    elif num > 10:  # Set a reasonable maximum
-                        self.num_scenes = 10
-                except ValueError:
-                    self.num_scenes = 3  # Default to 3 if invalid
-
+            elif rects["generate"].collidepoint(event.pos) and self.input_text.strip():
                 self.start_generation()
 
         elif event.type == pygame.KEYDOWN:
-            if self.active_input == "prompt":
-                if event.key == pygame.K_RETURN and self.input_text.strip():
-                    self.start_generation()
-                elif event.key == pygame.K_BACKSPACE:
-                    self.input_text = self.input_text[:-1]
-                elif event.key == pygame.K_TAB:
-                    self.active_input = "character"
-                else:
-                    self.input_text += event.unicode
-
-            elif self.active_input == "character":
-                if event.key == pygame.K_RETURN and self.input_text.strip():
-                    self.start_generation()
-                elif event.key == pygame.K_BACKSPACE:
-                    self.character_desc = self.character_desc[:-1]
-                elif event.key == pygame.K_TAB:
-                    self.active_input = "setting"
-                else:
-                    self.character_desc += event.unicode
-
-            elif self.active_input == "setting":
-                if event.key == pygame.K_RETURN and self.input_text.strip():
-                    self.start_generation()
-                elif event.key == pygame.K_BACKSPACE:
-                    self.setting_desc = self.setting_desc[:-1]
-                elif event.key == pygame.K_TAB:
-                    self.active_input = "scenes"
-                else:
-                    self.setting_desc += event.unicode
-
+            handler = self._input_key_handlers.get(event.key)
+            if handler:
+                handler()
             elif self.active_input == "scenes":
-                if event.key == pygame.K_RETURN and self.input_text.strip():
-                    self.start_generation()
-                elif event.key == pygame.K_BACKSPACE:
-                    self.num_scenes = str(self.num_scenes)[:-1] or "3"  # Default to 3 if empty
-                elif event.key == pygame.K_TAB:
-                    self.active_input = "prompt"
-                elif event.unicode.isdigit():
-                    new_value = str(self.num_scenes) + event.unicode if isinstance(self.num_scenes, int) else event.unicode
-                    try:
-                        num = int(new_value)
-                        if 1 <= num <= 10:  # Set a reasonable range
-                            self.num_scenes = num
-                    except ValueError:
-                        pass  # Ignore if not a valid number
+                self._type_scenes_digit(event.unicode)
+            elif event.unicode and event.unicode.isprintable():
+                # Modifier and navigation keys have no text and must not leave empty entries behind
+                self._buffers[self.active_input].append(event.unicode)
+
+    def _submit_input(self):
+        """Start generating on Enter once a story idea has been entered"""
+        if self.input_text.strip():
+            self.start_generation()
+
+    def _focus_next_input(self):
+        """Move to the next input box on Tab"""
+        self.active_input = NEXT_INPUT[self.active_input]
+
+    def _erase_input(self):
+        """Delete the last character of the active input on Backspace"""
+        if self.active_input == "scenes":
+            self.num_scenes //= 10  # 0 leaves the box empty, so the next digit replaces the count
+        elif self._buffers[self.active_input]:
+            self._buffers[self.active_input].pop()
+
+    def _type_scenes_digit(self, char):
+        """Add a typed digit to the number of scenes, if the result stays within range"""
+        if len(char) == 1 and "0" <= char <= "9":
+            candidate = self.num_scenes * 10 + ord(char) - 48
+            if candidate <= 10:  # Set a reasonable range
+                self.num_scenes = candidate
 
     def handle_viewing_events(self, event):
         """Handle events for the story viewing screen"""
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            # Previous button - updated coordinates
-            prev_button = pygame.Rect(80, SCREEN_HEIGHT - 60, 130, 40)
-            if prev_button.collidepoint(event.pos) and self.current_page > 0:
-                self.current_page -= 1
-                logging.debug(f"Navigation: Moving to page {self.current_page + 1}")
-
-            # Next button - updated coordinates
-            next_button = pygame.Rect(SCREEN_WIDTH - 210, SCREEN_HEIGHT - 60, 130, 40)
-            if next_button.collidepoint(event.pos) and self.current_page < len(self.story_scenes) - 1:
-                self.current_page += 1
-                logging.debug(f"Navigation: Moving to page {self.current_page + 1}")
-
-            # New story button - updated coordinates
-            new_story_button = pygame.Rect(SCREEN_WIDTH//2 - 100, SCREEN_HEIGHT - 60, 200, 40)
-            if new_story_button.collidepoint(event.pos):
-                logging.debug(f"=== STARTING NEW STORY ===")
-                self.state = "input"
-                self.input_text = ""
-                self.character_desc = ""
-                self.setting_desc = ""
-                self.story_scenes = []
-                self.generated_images = []
-                self.current_page = 0
-                self.status_message = ""
-                self.image_loading = []
-
-            # Main menu button
-            main_menu_button = pygame.Rect(SCREEN_WIDTH//2 - 100, SCREEN_HEIGHT - 110, 200, 40)
-            if main_menu_button.collidepoint(event.pos):
-                logging.debug("Returning to main menu")
-                self.state = "start_menu"
-                return
-
-            # Save button
-            save_button = pygame.Rect(80, SCREEN_HEIGHT - 110, 130, 40)
-            if save_button.collidepoint(event.pos):
-                self.show_save_dialog()
-                return
+        if event.type == pygame.MOUSEBUTTONDOWN and self._viewing_bbox.collidepoint(event.pos):
+            for rect, callback in self._viewing_buttons:
+                if rect.collidepoint(event.pos):
+                    callback()
+                    break
+
+    def _previous_page(self):
+        """Go back one page, unless on the first"""
+        if self.current_page > 0:
+            self.current_page -= 1
+            logging.debug("Navigation: Moving to page %s", self.current_page + 1)
+
+    def _next_page(self):
+        """Go forward one page, unless on the last"""
+        if self.current_page < len(self.story_scenes) - 1:
+            self.current_page += 1
+            logging.debug("Navigation: Moving to page %s", self.current_page + 1)
+
+    def _new_story(self):
+        """Drop the current story and go back to the input screen"""
+        logging.debug("=== STARTING NEW STORY ===")
+        self.thread = None  # Ignore any results still arriving for the current story
+        self.state = "input"
+        self.active_input = "prompt"  # May still be "file" from a dialog
+        self.input_text = ""
+        self.character_desc = ""
+        self.setting_desc = ""
+        self.story_scenes = []
+        self.generated_images = []
+        self._clear_page_cache()
+        self.current_page = 0
+        self.status_message = ""
+        self.image_loading = []
 
-            # Load button
-            load_button = pygame.Rect(SCREEN_WIDTH - 210, SCREEN_HEIGHT - 110, 130, 40)
-            if load_button.collidepoint(event.pos):
-                self.show_load_dialog()
-                return
+    def _return_to_main_menu(self):
+        logging.debug("Returning to main menu")
+        self.state = "start_menu"
 
     def handle_file_dialog_events(self, event):
         """Handle events for the file dialog"""
-        dialog_width = 600
-        dialog_height = 500
-        dialog_x = (SCREEN_WIDTH - dialog_width) // 2
-        dialog_y = (SCREEN_HEIGHT - dialog_height) // 2
-
         if event.type == pygame.MOUSEBUTTONDOWN:
             # Check if clicked outside the dialog (close it)
-            dialog_rect = pygame.Rect(dialog_x, dialog_y, dialog_width, dialog_height)
-            if not dialog_rect.collidepoint(event.pos):
+            rects = self._rects
+            if not rects["dialog"].collidepoint(event.pos):
                 self.show_file_dialog = False
                 return
 
             # Check for input box click (save mode)
             if self.file_dialog_mode == "save":
-                input_box = pygame.Rect(dialog_x + 30, dialog_y + 110, dialog_width - 60, 40)
-                if input_box.collidepoint(event.pos):
+                if rects["dialog_input"].collidepoint(event.pos):
                     # Activate input box
                     self.active_input = "file"
                     return
 
             # Check for file list click
-            list_box = pygame.Rect(dialog_x + 30, 
-                                  dialog_y + (190 if self.file_dialog_mode == "save" else 100), 
-                                  dialog_width - 60, 250)
+            list_box = rects["save_list" if self.file_dialog_mode == "save" else "load_list"]
             if list_box.collidepoint(event.pos) and self.file_list:
                 # Calculate which item was clicked
                 item_height = 30
@@ -1415,30 +2246,10 @@ class UI:
                         self.file_input = self.file_list[item_index].get("filename", "").replace(".story", "")
                 return
 
-            # Check for cancel button
-            cancel_button = pygame.Rect(dialog_x + 30, dialog_y + dialog_height - 60, 150, 40)
-            if cancel_button.collidepoint(event.pos):
-                self.show_file_dialog = False
-                return
-
-            # Check for action button (save/load)
-            action_button = pygame.Rect(dialog_x + dialog_width - 180, dialog_y + dialog_height - 60, 150, 40)
-            button_active = (self.file_dialog_mode == "save" and self.file_input.strip()) or \
-                            (self.file_dialog_mode == "load" and self.selected_file_index >= 0)
-
-            if action_button.collidepoint(event.pos) and button_active:
-                if self.file_dialog_mode == "save":
-                    self.save_current_story()
-                else:  # load
-                    self.load_selected_story()
-                self.show_file_dialog = False
-                return
-
-            # Check for delete button (load mode)
-            if self.file_dialog_mode == "load" and self.selected_file_index >= 0:
-                delete_button = pygame.Rect(dialog_x + dialog_width//2 - 75, dialog_y + dialog_height - 60, 150, 40)
-                if delete_button.collidepoint(event.pos):
-                    self.delete_selected_story()
+            # Cancel, save/load and delete buttons
+            for rect, callback in self._dialog_buttons:
+                if rect.collidepoint(event.pos):
+                    callback()
                     return
 
         elif event.type == pygame.KEYDOWN:
@@ -1447,19 +2258,39 @@ class UI:
                     self.save_current_story()
                     self.show_file_dialog = False
                 elif event.key == pygame.K_BACKSPACE:
-                    self.file_input = self.file_input[:-1]
+                    if self._buffers["file"]:
+                        self._buffers["file"].pop()
                 elif event.key == pygame.K_ESCAPE:
                     self.show_file_dialog = False
                 else:
                     # Filter for valid filename characters
-                    valid_chars = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_ "
-                    if event.unicode in valid_chars:
-                        self.file_input += event.unicode
+                    if event.unicode in _VALID_FILENAME_CHARS:
+                        self._buffers["file"].append(event.unicode)
             elif event.key == pygame.K_ESCAPE:
                 self.show_file_dialog = False
 
     # ----- File Operation Methods -----
 
+    def _close_file_dialog(self):
+        self.show_file_dialog = False
+
+    def _confirm_file_dialog(self):
+        """Save or load, if the dialog has a filename or a selected story to act on"""
+        button_active = (self.file_dialog_mode == "save" and self.file_input.strip()) or \
+                        (self.file_dialog_mode == "load" and self.selected_file_index >= 0)
+        if not button_active:
+            return
+        if self.file_dialog_mode == "save":
+            self.save_current_story()
+        else:  # load
+            self.load_selected_story()
+        self.show_file_dialog = False
+
+    def _delete_from_file_dialog(self):
+        """Delete the selected story; the button only exists in the load dialog"""
+        if self.file_dialog_mode == "load" and self.selected_file_index >= 0:
+            self.delete_selected_story()
+
     def show_save_dialog(self):
         """Show the save dialog"""
         self.show_file_dialog = True
@@ -1503,7 +2334,7 @@ class UI:
 
             if success:
                 self.status_message = f"Story saved as '{filename}'"
-                logging.debug(f"Story saved: {filename}")
+                logging.debug("Story saved: %s", filename)
                 return True
             else:
                 self.status_message = "Error saving story!"
@@ -1529,9 +2360,11 @@ class UI:
             try:
                 metadata, story_scenes, generated_images = self.story_storage.load_story(filename)
 
-                # Update UI with loaded story
+                # Update UI with loaded story, ignoring any results still arriving for a generated one
+                self.thread = None
                 self.story_scenes = story_scenes
                 self.generated_images = generated_images
+                self._clear_page_cache()
                 self.story_prompt = metadata.get("prompt", "")
                 self.genre = metadata.get("genre", "Fantasy")
                 self.tone = metadata.get("tone", "Lighthearted")
@@ -1541,19 +2374,16 @@ class UI:
                 self.num_scenes = len(story_scenes)
 
                 # Extract image URLs if available
-                self.image_url_list = []
-                for scene in metadata.get("scenes", []):
-                    self.image_url_list.append(scene.get("image_url"))
+                self.image_url_list = [scene.get("image_url") for scene in metadata.get("scenes", [])]
 
                 # Make sure we have the right number of URL slots
-                while len(self.image_url_list) < len(story_scenes):
-                    self.image_url_list.append(None)
+                self.image_url_list.extend([None] * (len(story_scenes) - len(self.image_url_list)))
 
                 self.state = "viewing"
                 self.current_page = 0
                 self.status_message = f"Story '{metadata.get('title', 'Untitled')}' loaded!"
 
-                logging.debug(f"Story loaded: {filename}")
+                logging.debug("Story loaded: %s", filename)
                 return True
 
             except Exception as e:
@@ -1589,17 +2419,22 @@ class UI:
 
     def start_generation(self):
         """Start the story generation process in a separate thread"""
+        # An emptied scenes box falls back to the default; anything else is kept within range
+        self.num_scenes = min(max(self.num_scenes or 3, 1), 10)
         self.story_prompt = self.input_text
-        logging.debug(f"=== GENERATION STARTED ===")
-        logging.debug(f"User prompt: '{self.story_prompt}'")
-        logging.debug(f"Genre: {self.genre}, Tone: {self.tone}")
-        logging.debug(f"Character: '{self.character_desc}'")
-        logging.debug(f"Setting: '{self.setting_desc}'")
-        logging.debug(f"Number of scenes: {self.num_scenes}")
+        logging.debug(
+            "=== GENERATION STARTED ===\nUser prompt: '%s'\nGenre: %s, Tone: %s\nCharacter: '%s'\n"
+            "Setting: '%s'\nNumber of scenes: %s",
+            self.story_prompt, self.genre, self.tone, self.character_desc, self.setting_desc, self.num_scenes
+        )
 
         self.state = "generating"
         self.status_message = "Starting generation..."
         self.image_loading = [False] * self.num_scenes
+        self.story_scenes = []
+        self.generated_images = []
+        self.image_url_list = []
+        self._clear_page_cache()
 
         # Start generation in a separate thread
         self.thread = threading.Thread(target=self.generate_story_thread)
@@ -1617,50 +2452,39 @@ class UI:
                 self.num_scenes,
                 self.character_desc,
                 self.setting_desc,
-                self.art_style
+                self.art_style,
+                fetch_images=PREFETCH_IMAGES
             )
 
-            # Process the results
+            if not self._is_active_generation():
+                return
+
+            # Process the results; images were already converted as each one arrived
             with self.lock:
+                # Normally the scenes on_scenes_ready already received, whose page images are cached by
+                # now; only their wrapped text has to go if they differ
+                if story_scenes != self.story_scenes:
+                    self._wrapped_cache.clear()
                 self.story_scenes = story_scenes
                 self.image_url_list = image_url_list  # Store the image URLs
 
-                # Convert image data to pygame surfaces
-                self.generated_images = []
-                for img_data in image_data_list:
-                    if img_data:
-                        try:
-                            # Convert to pygame surface
-                            image = pygame.image.load(io.BytesIO(img_data))
-
-                            # Scale to fit if needed
-                            if image.get_width() != IMG_DIM["width"] or image.get_height() != IMG_DIM["height"]:
-                                image = pygame.transform.scale(image, (IMG_DIM["width"], IMG_DIM["height"]))
-
-                            self.generated_images.append(image)
-                        except Exception as e:
-                            logging.error(f"Error converting image: {str(e)}")
-                            self.generated_images.append(None)
-                    else:
-                        self.generated_images.append(None)
+                # Ensure we have placeholders for all scenes and their image URLs
+                self.generated_images.extend([None] * (len(self.story_scenes) - len(self.generated_images)))
+                self.image_url_list.extend([None] * (len(self.story_scenes) - len(self.image_url_list)))
 
-                # Ensure we have placeholders for all scenes
-                while len(self.generated_images) < len(self.story_scenes):
-                    self.generated_images.append(None)
-
-                # Ensure we have placeholders for all image URLs
-                while len(self.image_url_list) < len(self.story_scenes):
-                    self.image_url_list.append(None)
-
-                self.state = "viewing"
-                self.current_page = 0
+                # Switch to the story if the first image did not already do so
+                if self.state == "generating":
+                    self.state = "viewing"
+                    self.current_page = 0
                 self.status_message = ""
+                self._dirty = True
 
         except Exception as e:
             logging.error(f"Error in generate_story_thread: {str(e)}")
             with self.lock:
                 self.status_message = f"Error generating story: {str(e)}"
                 self.state = "input"
+                self._dirty = True
 
     # ----- Main Loop -----
 
@@ -1669,50 +2493,106 @@ class UI:
         running = True
         clock = pygame.time.Clock()
 
-        logging.debug(f"=== APPLICATION STARTED ===")
-        logging.debug(f"Screen dimensions: {SCREEN_WIDTH}x{SCREEN_HEIGHT}")
-        logging.debug(f"Image dimensions: {IMG_DIM}")
-        logging.debug(f"Default number of scenes: {self.num_scenes}")
+        logging.debug(
+            "=== APPLICATION STARTED ===\nScreen dimensions: %sx%s\nImage dimensions: %s\n"
+            "Default number of scenes: %s",
+            SCREEN_WIDTH, SCREEN_HEIGHT, IMG_DIM, self.num_scenes
+        )
 
         while running:
-            for event in pygame.event.get():
+            # Only the generating screen animates on its own; elsewhere, once everything is drawn,
+            # sleep until the next event instead of polling at the frame rate
+            if self.state == "generating" or self._dirty or self._dirty_rects:
+                events = pygame.event.get()
+            else:
+                event = pygame.event.wait(IDLE_WAIT_MS)
+                events = [] if event.type == pygame.NOEVENT else [event] + pygame.event.get()
+
+            # Several clicks on the story page within one frame are a double-click, not a request to
+            # turn several pages; only the last one is handled
+            if len(events) > 1 and self.state == "viewing" and not self.show_file_dialog:
+                clicks = [e for e in events if e.type == pygame.MOUSEBUTTONDOWN]
+                if len(clicks) > 1:
+                    last_click = clicks[-1]
+                    events = [e for e in events if e.type != pygame.MOUSEBUTTONDOWN or e is last_click]
+
+            for event in events:
                 if event.type == pygame.QUIT:
-                    logging.debug(f"=== APPLICATION CLOSING ===")
+                    logging.debug("=== APPLICATION CLOSING ===")
                     running = False
 
+                # Typing only changes its input row (its TEXTINPUT twin changes nothing), and any
+                # other event may change the whole screen
+                typing_area = self._typing_area(event)
+                if typing_area:
+                    self._dirty_rects.append(typing_area)
+                elif event.type != pygame.TEXTINPUT:
+                    self._dirty = True
+
+                if event.type == pygame.WINDOWMINIMIZED:
+                    self._minimized = True
+                elif event.type in (pygame.WINDOWRESTORED, pygame.WINDOWSHOWN, pygame.WINDOWMAXIMIZED):
+                    self._minimized = False
+
+                # Decoded scene images are stored whatever is on screen
+                if event.type == IMAGE_READY_EVENT:
+                    self.handle_image_ready(event)
+                    continue
+
                 # Handle file dialog events first
                 if self.show_file_dialog:
                     self.handle_file_dialog_events(event)
                     continue
 
                 # Handle events based on state
-                if self.state == "start_menu":
-                    self.handle_start_menu_events(event)
-                elif self.state == "input":
-                    self.handle_input_events(event)
-                elif self.state == "viewing":
-                    self.handle_viewing_events(event)
-
-            # Draw based on state
-            with self.lock:
-                if self.state == "start_menu":
-                    self.draw_start_menu()
-                elif self.state == "input":
-                    self.draw_input_screen()
-                elif self.state == "generating":
-                    self.draw_generating_screen()
-                elif self.state == "viewing":
-                    self.draw_story_page()
+                handler = self._event_handlers.get(self.state)
+                if handler:
+                    handler(event)
+
+            if self.state == "viewing" and not PREFETCH_IMAGES:
+                self._fetch_page_image(self.current_page)
+
+            # While minimized, keep handling events at a low rate and skip drawing; the screen is marked
+            # dirty, so it is redrawn in full when the window comes back
+            if self._minimized:
+                self._dirty = True
+                pygame.time.wait(100)
+                continue
+
+            # Draw based on state, only when something changed. No lock is taken: the generation
+            # threads only replace the story lists wholesale or store single items, so a frame sees
+            # either the old or the new value, and draw_story_page reads each list once
+            now = pygame.time.get_ticks()
+            if self._status_pending and now - self._last_status_paint >= STATUS_REPAINT_INTERVAL_MS:
+                self._status_pending = False
+                self._last_status_paint = now
+                self._dirty = True
+            full_redraw = self._dirty
+            dirty_rects = self._dirty_rects
+            if full_redraw:
+                self._dirty = False
+                self._dirty_rects = []
+                self._draw_handlers[self.state]()
 
                 # Draw file dialog on top if needed
                 if self.show_file_dialog:
                     self.draw_file_dialog()
-
-            pygame.display.flip()
+            elif dirty_rects:
+                # Only typing marks part of the screen, so just the active input row is repainted
+                self._dirty_rects = []
+                for rect in dirty_rects:
+                    self.screen.fill(WHITE, rect)
+                self._draw_input_row(self.active_input)
+
+            if full_redraw:
+                pygame.display.flip()
+            elif dirty_rects:
+                pygame.display.update(dirty_rects)
             clock.tick(30)
 
         pygame.quit()
 
 if __name__ == "__main__":
+    _bootstrap()
     app = UI(num_scenes=3)  # Default to 3 scenes, but it's configurable
     app.run()
\ No newline at end of file
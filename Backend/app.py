@@ -1,6 +1,7 @@
 # app.py
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 import os
 from routes import story_routes, image_routes
@@ -9,7 +10,9 @@ from config import settings, CORS_ORIGINS
 app = FastAPI(
     title="DreamTeller API",
     description="API for generating AI stories and illustrations using FAL AI",
-    version="2.0.0"
+    version="2.0.0",
+    # Encode JSON responses with orjson instead of the standard library's json module
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -25,8 +28,8 @@ app.add_middleware(
 os.makedirs(settings.STORIES_DIR, exist_ok=True)
 
 # Mount static files for serving saved stories if needed
-if os.path.exists(settings.STORIES_DIR):
-    app.mount(f"/stories", StaticFiles(directory=settings.STORIES_DIR), name="stories")
+if os.path.isdir(settings.STORIES_DIR):
+    app.mount("/stories", StaticFiles(directory=settings.STORIES_DIR), name="stories")
 
 # Include routers
 app.include_router(story_routes.router, prefix="/api/stories", tags=["stories"])
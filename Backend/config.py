@@ -1,18 +1,46 @@
 # config.py
 import os
-from typing import List
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Every setting read from the environment, as (name, type, default), parsed in one pass below
+_ENV_SPECS = [
+    # FAL AI Settings
+    ("FAL_KEY", str, ""),
+    # Image Generation Settings - Using FAL AI optimal values
+    # Note: We now use FAL AI's predefined image_size enums instead of custom dimensions
+    ("DEFAULT_IMAGE_SIZE", str, "landscape_4_3"),  # Good default for stories
+    ("DIFFUSION_STEPS", int, "4"),                 # Optimal for FLUX schnell
+    # Database Settings
+    ("DATABASE_URL", str, "sqlite:///./dreamteller.db"),
+    # Server settings
+    ("API_PORT", int, "5000"),
+    # Number of scenes in a story
+    ("DEFAULT_SCENE_COUNT", int, "5"),
+    # Story storage directory
+    ("STORIES_DIR", str, "stories"),
+    # Image quality settings
+    ("IMAGE_QUALITY", float, "0.95"),  # JPEG quality for saved images
+    ("IMAGE_TIMEOUT", int, "60"),      # Timeout for image downloads
+    # Logging settings
+    ("LOG_LEVEL", str, "INFO"),
+    ("LOG_FILE", str, "dreamteller.log"),
+]
+
+_env = os.environ
+_values = {name: cast(_env.get(name, default)) for name, cast, default in _ENV_SPECS}
+
 # FAL AI Settings
-FAL_KEY = os.getenv("FAL_KEY", "")
+FAL_KEY = _values["FAL_KEY"]
 
-# Image Generation Settings - Using FAL AI optimal values
-# Note: We now use FAL AI's predefined image_size enums instead of custom dimensions
-DEFAULT_IMAGE_SIZE = os.getenv("DEFAULT_IMAGE_SIZE", "landscape_4_3")  # Good default for stories
-DIFFUSION_STEPS = int(os.getenv("DIFFUSION_STEPS", "4"))  # Optimal for FLUX schnell
+# Image Generation Settings
+DEFAULT_IMAGE_SIZE = _values["DEFAULT_IMAGE_SIZE"]
+DIFFUSION_STEPS = _values["DIFFUSION_STEPS"]
 
 # Available image sizes for FAL AI FLUX model
 AVAILABLE_IMAGE_SIZES = [
@@ -36,18 +64,18 @@ ART_STYLE_IMAGE_SIZE_MAP = {
 }
 
 # Database Settings
-DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./dreamteller.db")
+DATABASE_URL = _values["DATABASE_URL"]
 
 # Server settings
-API_PORT = int(os.getenv("API_PORT", "5000"))
+API_PORT = _values["API_PORT"]
 
 # Number of scenes in a story
-DEFAULT_SCENE_COUNT = int(os.getenv("DEFAULT_SCENE_COUNT", "5"))
+DEFAULT_SCENE_COUNT = _values["DEFAULT_SCENE_COUNT"]
 MIN_SCENE_COUNT = 3
 MAX_SCENE_COUNT = 10
 
 # Story storage directory
-STORIES_DIR = os.getenv("STORIES_DIR", "stories")
+STORIES_DIR = _values["STORIES_DIR"]
 
 # CORS settings
 def get_cors_origins() -> List[str]:
@@ -60,37 +88,66 @@ def get_cors_origins() -> List[str]:
 CORS_ORIGINS = get_cors_origins()
 
 # Image quality settings
-IMAGE_QUALITY = float(os.getenv("IMAGE_QUALITY", "0.95"))  # JPEG quality for saved images
-IMAGE_TIMEOUT = int(os.getenv("IMAGE_TIMEOUT", "60"))      # Timeout for image downloads
+IMAGE_QUALITY = _values["IMAGE_QUALITY"]
+IMAGE_TIMEOUT = _values["IMAGE_TIMEOUT"]
 
 # Logging settings
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
-LOG_FILE = os.getenv("LOG_FILE", "dreamteller.log")
+LOG_LEVEL = _values["LOG_LEVEL"]
+LOG_FILE = _values["LOG_FILE"]
 
 # Create a settings object for compatibility with the rest of the code
+@dataclass(slots=True, frozen=True)
 class Settings:
-    def __init__(self):
-        self.FAL_KEY = FAL_KEY
-        self.DEFAULT_IMAGE_SIZE = DEFAULT_IMAGE_SIZE
-        self.DIFFUSION_STEPS = DIFFUSION_STEPS
-        self.AVAILABLE_IMAGE_SIZES = AVAILABLE_IMAGE_SIZES
-        self.ART_STYLE_IMAGE_SIZE_MAP = ART_STYLE_IMAGE_SIZE_MAP
-        self.DATABASE_URL = DATABASE_URL
-        self.API_PORT = API_PORT
-        self.DEFAULT_SCENE_COUNT = DEFAULT_SCENE_COUNT
-        self.MIN_SCENE_COUNT = MIN_SCENE_COUNT
-        self.MAX_SCENE_COUNT = MAX_SCENE_COUNT
-        self.STORIES_DIR = STORIES_DIR
-        self.IMAGE_QUALITY = IMAGE_QUALITY
-        self.IMAGE_TIMEOUT = IMAGE_TIMEOUT
-        self.LOG_LEVEL = LOG_LEVEL
-        self.LOG_FILE = LOG_FILE
-        
-        # Backward compatibility - these are no longer used but kept for any legacy code
-        self.IMAGE_WIDTH = 1024   # Default landscape_4_3 width
-        self.IMAGE_HEIGHT = 768   # Default landscape_4_3 height
-
-settings = Settings()
+    FAL_KEY: str = field(repr=False)  # Kept out of the repr so settings can be logged safely
+    DEFAULT_IMAGE_SIZE: str
+    DIFFUSION_STEPS: int
+    AVAILABLE_IMAGE_SIZES: List[str]
+    ART_STYLE_IMAGE_SIZE_MAP: Dict[str, str]
+    DATABASE_URL: str
+    API_PORT: int
+    DEFAULT_SCENE_COUNT: int
+    MIN_SCENE_COUNT: int
+    MAX_SCENE_COUNT: int
+    STORIES_DIR: str
+    IMAGE_QUALITY: float
+    IMAGE_TIMEOUT: int
+    LOG_LEVEL: str
+    LOG_FILE: str
+
+    # Backward compatibility - these are no longer used but kept for any legacy code
+    IMAGE_WIDTH: int = 1024   # Default landscape_4_3 width
+    IMAGE_HEIGHT: int = 768   # Default landscape_4_3 height
+
+    def validate_image_size(self, image_size: str) -> bool:
+        """Validate that the image size is supported by FAL AI."""
+        return validate_image_size(image_size)
+
+    def get_image_size_for_art_style(self, art_style: str) -> str:
+        """Get the optimal image size for a given art style."""
+        return get_image_size_for_art_style(art_style)
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build the settings from the module values once; later calls return the same instance."""
+    return Settings(
+        FAL_KEY=FAL_KEY,
+        DEFAULT_IMAGE_SIZE=DEFAULT_IMAGE_SIZE,
+        DIFFUSION_STEPS=DIFFUSION_STEPS,
+        AVAILABLE_IMAGE_SIZES=AVAILABLE_IMAGE_SIZES,
+        ART_STYLE_IMAGE_SIZE_MAP=ART_STYLE_IMAGE_SIZE_MAP,
+        DATABASE_URL=DATABASE_URL,
+        API_PORT=API_PORT,
+        DEFAULT_SCENE_COUNT=DEFAULT_SCENE_COUNT,
+        MIN_SCENE_COUNT=MIN_SCENE_COUNT,
+        MAX_SCENE_COUNT=MAX_SCENE_COUNT,
+        STORIES_DIR=STORIES_DIR,
+        IMAGE_QUALITY=IMAGE_QUALITY,
+        IMAGE_TIMEOUT=IMAGE_TIMEOUT,
+        LOG_LEVEL=LOG_LEVEL,
+        LOG_FILE=LOG_FILE
+    )
+
+settings = get_settings()
 
 # Validation functions
 def validate_image_size(image_size: str) -> bool: